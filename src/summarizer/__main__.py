@@ -21,4 +21,8 @@ from .main import main
 
 # Call main() and exit with its return code
 # Using raise SystemExit is equivalent to sys.exit() but doesn't require importing sys
-raise SystemExit(main())
+# On success (0 or None) we just fall off the end - the exit code is 0 anyway,
+# so there's no need to go through the exception machinery
+rc = main()
+if rc:
+    raise SystemExit(rc)
@@ -0,0 +1,117 @@
+"""
+File-backed cache of generated summaries.
+
+Re-running the summarizer for the same two weeks of entries (with --force,
+say, while tweaking something unrelated) would otherwise pay for the same
+Claude call again. Each cached summary is stored as one small JSON file,
+named by a hash of the whole request:
+
+    ~/.cache/work-journal-summarizer/summaries/<sha256>.json
+
+The file holds the summary and how many of the (newest) entries it
+covers, since an over-budget prompt has its oldest entries dropped.
+
+The cache only makes sense when the model's output is deterministic, so
+generate_summary() only uses it when the configured temperature is 0.
+With any other temperature a re-run is expected to produce a new summary.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+def get_summary_cache_path() -> Path:
+    """Directory holding cached summaries (~/.cache/work-journal-summarizer/summaries/)."""
+    return Path.home() / ".cache" / "work-journal-summarizer" / "summaries"
+
+
+def summary_cache_key(
+    model: str,
+    max_tokens: int,
+    temperature: float | None,
+    system: list[dict],
+    user_content: list[dict],
+    max_prompt_tokens: int | None = None,
+) -> str:
+    """
+    Build the cache key for a summary request.
+
+    The key covers everything sent to the API: the model, its settings, the
+    instructions, and the user message built from the entries - plus the
+    prompt token budget, which decides how many entries get sent. Change any of them
+    (edit an entry, tweak the instructions, switch model) and it's a
+    different key, i.e. a cache miss.
+
+    Syntax notes:
+    - json.dumps(..., sort_keys=True) gives the same text for the same data
+      every time, which is what we need before hashing
+    - hashlib.sha256(...).hexdigest() gives a 64-character hex string
+
+    Args:
+        model: The Claude model used
+        max_tokens: Maximum tokens in the response
+        temperature: Sampling temperature (None for the API default)
+        system: System prompt content blocks, from build_prompt()
+        user_content: User message content blocks, from build_prompt()
+        max_prompt_tokens: Prompt token budget the entries were trimmed to
+
+    Returns:
+        The cache key as a hex string
+    """
+    canonical = json.dumps(
+        {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system,
+            "user_content": user_content,
+            "max_prompt_tokens": max_prompt_tokens,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def get_cached_summary(key: str) -> tuple[str, int] | None:
+    """
+    Look up a cached summary.
+
+    Args:
+        key: Cache key from summary_cache_key()
+
+    Returns:
+        Tuple of (summary, entries_kept), or None if there isn't one (or it
+        can't be read)
+    """
+    try:
+        data = json.loads((get_summary_cache_path() / f"{key}.json").read_text(encoding="utf-8"))
+        return data["summary"], data["entries_kept"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_summary(key: str, summary: str, entries_kept: int) -> None:
+    """
+    Store a summary in the cache.
+
+    We write to a temp file and then os.replace() it into place, so a
+    half-written file is never mistaken for a cached summary. Failure to
+    save just means the next identical run calls the API again.
+
+    Args:
+        key: Cache key from summary_cache_key()
+        summary: The generated summary text
+        entries_kept: How many of the newest entries the summary covers
+    """
+    cache_dir = get_summary_cache_path()
+    final_path = cache_dir / f"{key}.json"
+    tmp_path = cache_dir / f"{key}.json.tmp"
+    data = {"summary": summary, "entries_kept": entries_kept}
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, final_path)
+    except OSError as e:
+        print(f"Warning: Failed to cache summary: {e}")
@@ -0,0 +1,171 @@
+"""
+Shrink journal text before sending it to Claude.
+
+Journal entries are written quickly and contain a lot of text that costs
+input tokens without adding meaning: trailing spaces, runs of blank lines,
+HTML comments left over from templates, wordy stock phrases, and
+boilerplate paragraphs repeated day after day. This module strips those
+with simple, deterministic rules - no API calls - so the summary prompt
+is smaller (cheaper, and faster to process).
+
+What we never touch:
+- Code, fenced (``` ... ```) or inline (`...`): whitespace and wording
+  matter there
+- Leading indentation: it carries markdown structure (nested bullets)
+- Two or more spaces ending a line: that's a markdown line break
+"""
+
+import hashlib
+import re
+
+
+# Code: fenced blocks, from an opening ``` to the next closing ```, or
+# inline spans like `make test` (within one line)
+#
+# Syntax notes:
+# - re.S ("dotall") lets . match newlines too, so a match can span lines
+# - .*? is "lazy": it stops at the FIRST closing ```, not the last one
+# - Alternatives are tried left to right, so a fence is never mistaken
+#   for an empty inline span
+# - [^`\n]+ is one or more characters that are neither ` nor a newline
+_CODE_RE = re.compile(r"```.*?```|`[^`\n]+`", re.S)
+
+# Stand-in for a piece of code while the other rules run. \x00 never appears
+# in journal text, so it can't collide with real content.
+_PLACEHOLDER = "\x00{}\x00"
+_PLACEHOLDER_RE = re.compile(r"\x00(\d+)\x00")
+
+# HTML comments (<!-- ... -->), e.g. hints left in from an entry template
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+
+# Runs of spaces/tabs between two non-space characters (i.e. not
+# indentation, and not at the end of a line)
+# (?<=\S) is a "lookbehind" and (?=\S) a "lookahead": the run must follow
+# and be followed by a non-space character, but those aren't part of the match
+_INNER_SPACES_RE = re.compile(r"(?<=\S)[ \t]{2,}(?=\S)")
+
+# Spaces/tabs at the end of a line (re.M makes $ match at every line end).
+# The first alternative captures a markdown line break (two or more spaces
+# right after text) so it can be put back; anything else is dropped.
+_TRAILING_SPACES_RE = re.compile(r"(?<=\S)( {2,})$|[ \t]+$", re.M)
+
+# Three or more newlines in a row (i.e. two or more blank lines)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Wordy phrases and their shorter equivalents. Only exact synonyms: the
+# summary must read the same whether or not a phrase was swapped.
+_VERBOSE_PHRASES = {
+    "in order to": "to",
+    "due to the fact that": "because",
+    "at this point in time": "now",
+    "at the present time": "now",
+    "in the event that": "if",
+    "a large number of": "many",
+    "in spite of the fact that": "although",
+    "is able to": "can",
+    "are able to": "can",
+}
+
+# One regex matching any of the phrases, as whole words, in any case
+# re.escape() makes sure any special characters in a phrase match literally
+_VERBOSE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in _VERBOSE_PHRASES) + r")\b",
+    re.I,
+)
+
+
+def _shorten_phrase(match: re.Match) -> str:
+    """
+    Replacement function for _VERBOSE_RE: look up the shorter phrase.
+
+    Keeps a leading capital ("In order to" -> "To").
+    """
+    phrase = match.group(0)
+    replacement = _VERBOSE_PHRASES[phrase.lower()]
+    if phrase[0].isupper():
+        replacement = replacement[0].upper() + replacement[1:]
+    return replacement
+
+
+def compress(text: str) -> str:
+    """
+    Apply all the compression rules to a piece of journal text.
+
+    Syntax notes:
+    - re.sub() can take a function instead of a replacement string; it's
+      called with each match object and returns the text to put in its place
+    - set_aside() is defined inside compress() so it can add to this call's
+      `blocks` list
+
+    Args:
+        text: Journal entry text (markdown)
+
+    Returns:
+        The compressed text
+    """
+    # Set code aside, so none of the rules below can change it
+    blocks: list[str] = []
+
+    def set_aside(match: re.Match) -> str:
+        blocks.append(match.group(0))
+        return _PLACEHOLDER.format(len(blocks) - 1)
+
+    text = _CODE_RE.sub(set_aside, text)
+
+    text = _COMMENT_RE.sub("", text)
+    text = _VERBOSE_RE.sub(_shorten_phrase, text)
+    # \1 puts back a captured line break; it's empty when nothing was captured
+    text = _TRAILING_SPACES_RE.sub(r"\1", text)
+    text = _INNER_SPACES_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+
+    # Put the code back
+    if blocks:
+        text = _PLACEHOLDER_RE.sub(lambda m: blocks[int(m.group(1))], text)
+
+    return text.strip()
+
+
+# Paragraphs shorter than this are never deduplicated - short lines like
+# "- Tests pass" repeat legitimately and a back-reference wouldn't be shorter
+_MIN_DEDUPE_CHARS = 40
+
+
+def dedupe_paragraphs(text: str, label: str, seen: dict[bytes, str]) -> str:
+    """
+    Replace paragraphs already seen in an earlier entry with a short note.
+
+    Entries written from a template repeat the same boilerplate paragraphs
+    every day (standup headings, checklists, ...). The first occurrence is
+    kept; later ones become "[same as a paragraph from 2026-01-07]".
+
+    Call this once per entry, oldest first, passing the same `seen` dict
+    each time - it's how paragraphs are remembered across entries.
+
+    Syntax notes:
+    - hashlib.blake2b(..., digest_size=8) gives a short, fast fingerprint;
+      we store fingerprints rather than whole paragraphs to keep `seen` small
+    - dict.setdefault(key, value) stores value only if key isn't there yet,
+      and returns whatever is stored for key either way
+
+    Args:
+        text: One entry's text (markdown)
+        label: How to refer to this entry in notes (e.g. its date)
+        seen: Paragraph fingerprint -> label of the entry it first appeared in.
+              Updated in place.
+
+    Returns:
+        The text with repeated paragraphs replaced
+    """
+    paragraphs = text.split("\n\n")
+    for i, paragraph in enumerate(paragraphs):
+        stripped = paragraph.strip()
+        if len(stripped) < _MIN_DEDUPE_CHARS:
+            continue
+
+        fingerprint = hashlib.blake2b(stripped.encode(), digest_size=8).digest()
+        first_label = seen.setdefault(fingerprint, label)
+        if first_label != label:
+            paragraphs[i] = f"[same as a paragraph from {first_label}]"
+
+    return "\n\n".join(paragraphs)
@@ -15,16 +15,39 @@ Why YAML?
 - Standard for config files in modern tools
 """
 
+import functools
+import os
+import pickle
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml  # PyYAML - installed via: uv add pyyaml
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it.
+# It parses the same "safe" subset as SafeLoader, just much faster.
+# Not every platform ships libyaml, so fall back to the pure-Python loader.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 # ---------------------------------------------------------------------------
 # Config File Paths
 # ---------------------------------------------------------------------------
 
+# This file: src/summarizer/config.py
+# Parent 1:   src/summarizer/
+# Parent 2:   src/
+# Parent 3:   project root
+#
+# Computed once at import: __file__ never changes at runtime, and
+# .resolve() asks the OS to walk every path component (a syscall each time).
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_CONFIG_PATH = _PROJECT_ROOT / "config" / "config.yaml"
+_CONFIG_CACHE_PATH = _PROJECT_ROOT / "config" / ".config.cache.pkl"
+
+
 def get_project_root() -> Path:
     """
     Get the project root directory.
@@ -42,11 +65,7 @@ def get_project_root() -> Path:
     Returns:
         Path to the project root directory
     """
-    # This file: src/summarizer/config.py
-    # Parent 1:   src/summarizer/
-    # Parent 2:   src/
-    # Parent 3:   project root
-    return Path(__file__).resolve().parent.parent.parent
+    return _PROJECT_ROOT
 
 
 def get_config_path() -> Path:
@@ -56,7 +75,20 @@ def get_config_path() -> Path:
     Returns:
         Path to config/config.yaml
     """
-    return get_project_root() / "config" / "config.yaml"
+    return _CONFIG_PATH
+
+
+def get_config_cache_path() -> Path:
+    """
+    Get the path to the pickled config cache.
+
+    The cache lives next to config.yaml and is safe to delete at any time;
+    it's rebuilt on the next run.
+
+    Returns:
+        Path to config/.config.cache.pkl
+    """
+    return _CONFIG_CACHE_PATH
 
 
 # ---------------------------------------------------------------------------
@@ -86,10 +118,19 @@ DEFAULT_CONFIG = {
     "anthropic": {
         # Latest models as of Jan 2026 (from Anthropic announcements)
         # claude-sonnet-4-5: Best for coding, agents, complex reasoning
-        # claude-haiku-4-5: 4-5x faster than Sonnet, ideal for classification
-        "summary_model": "claude-sonnet-4-5",
+        # claude-haiku-4-5: 4-5x faster than Sonnet, at a fraction of the cost
+        # Summaries follow a fixed format, so Haiku handles them well; set
+        # summary_model (or pass --model) to use Sonnet for deeper synthesis
+        "summary_model": "claude-haiku-4-5",
         "classify_model": "claude-haiku-4-5",
+        # Heartbeat tasks (checkpoint reformatting, 3-5 sentence news vibe) are simple
+        "heartbeat_model": "claude-haiku-4-5",
         "max_tokens": 4096,
+        # Lower temperature = more focused (and usually shorter) summaries
+        # 0 makes them deterministic, which also enables the summary cache
+        "temperature": 0.2,
+        # Largest summary prompt we'll send; older entries are dropped to fit
+        "max_prompt_tokens": 150_000,
     },
     "secrets": {
         "base_path": "~/.secrets",
@@ -118,50 +159,131 @@ def load_config() -> dict:
     - We do a "deep merge" manually for nested dicts
     - YAML parsing returns Python dicts/lists directly
 
+    The returned dict is never copied defensively: with no config.yaml it
+    *is* DEFAULT_CONFIG, and after a merge it shares untouched sections with
+    DEFAULT_CONFIG. Callers must treat it as read-only (get() already does).
+
     Returns:
         Configuration dictionary with all settings
     """
-    config = _deep_copy(DEFAULT_CONFIG)
-
     config_path = get_config_path()
-    if config_path.exists():
-        try:
-            # yaml.safe_load() parses YAML to Python objects
-            # "safe" means it won't execute arbitrary Python (security)
-            with open(config_path) as f:
-                user_config = yaml.safe_load(f)
+    if not config_path.exists():
+        # Nothing to merge - the defaults are the whole config
+        return DEFAULT_CONFIG
+
+    # Reuse the previous run's merged config if config.yaml hasn't changed
+    cache_key = _config_cache_key(config_path)
+    cached = _read_config_cache(cache_key)
+    if cached is not None:
+        return cached
+
+    config = DEFAULT_CONFIG
+    try:
+        # yaml.load() with a Safe loader parses YAML to Python objects
+        # "safe" means it won't execute arbitrary Python (security)
+        # _Loader is CSafeLoader when available (see top of module)
+        # "rb" hands libyaml raw bytes - it detects and decodes UTF-8
+        # itself, so Python's text-mode decoding layer is just overhead
+        with open(config_path, "rb") as f:
+            user_config = yaml.load(f, Loader=_Loader)
+
+        if user_config:
+            # Deep merge user config over defaults (DEFAULT_CONFIG isn't modified)
+            config = _deep_merge(config, user_config)
+
+        _write_config_cache(cache_key, config)
+
+    except yaml.YAMLError as e:
+        print(f"Warning: Error parsing config.yaml: {e}")
+        print("Using default configuration.")
 
-            if user_config:
-                # Deep merge user config over defaults
-                config = _deep_merge(config, user_config)
+    return config
 
-        except yaml.YAMLError as e:
-            print(f"Warning: Error parsing config.yaml: {e}")
-            print("Using default configuration.")
 
-    return config
+# ---------------------------------------------------------------------------
+# Config Cache
+# ---------------------------------------------------------------------------
+
+# Parsing YAML on every run is wasted work when config.yaml rarely changes.
+# After a successful load we pickle the merged dict alongside a "cache key"
+# describing the inputs it was built from. On the next run, if the key still
+# matches, we unpickle the dict and skip YAML entirely.
+#
+# The key is (mtime, size, defaults):
+# - mtime + size of config.yaml change whenever the file is edited
+# - DEFAULT_CONFIG is included so code changes to defaults invalidate the cache
 
 
-def _deep_copy(d: dict) -> dict:
+def _config_cache_key(config_path: Path) -> tuple:
     """
-    Create a deep copy of a nested dictionary.
+    Build the cache key for the current config.yaml.
 
-    We can't just use d.copy() because that's shallow -
-    nested dicts would still reference the originals.
+    Syntax notes:
+    - .stat() returns file metadata (size, timestamps, ...)
+    - st_mtime_ns is the modification time in integer nanoseconds,
+      which avoids float rounding issues with st_mtime
 
     Args:
-        d: Dictionary to copy
+        config_path: Path to config.yaml
 
     Returns:
-        New dictionary with all nested dicts also copied
+        Tuple that changes whenever the cached config would be stale
     """
-    result = {}
-    for key, value in d.items():
-        if isinstance(value, dict):
-            result[key] = _deep_copy(value)
-        else:
-            result[key] = value
-    return result
+    stat = config_path.stat()
+    return (stat.st_mtime_ns, stat.st_size, DEFAULT_CONFIG)
+
+
+def _read_config_cache(cache_key: tuple) -> dict | None:
+    """
+    Load the cached config if it was built from the same inputs.
+
+    The cache file holds two pickled objects back to back: the key, then
+    the config. We unpickle the key first so a stale cache costs only a
+    tiny read.
+
+    Any problem reading the cache (missing, truncated, written by another
+    Python version) is treated as a cache miss.
+
+    Args:
+        cache_key: Key from _config_cache_key()
+
+    Returns:
+        The cached configuration, or None on a miss
+    """
+    cache_path = get_config_cache_path()
+    try:
+        with open(cache_path, "rb") as f:
+            if pickle.load(f) != cache_key:
+                return None
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+
+
+def _write_config_cache(cache_key: tuple, config: dict) -> None:
+    """
+    Save the merged config for the next run.
+
+    We write to a temp file and then os.replace() it into place, so a
+    crash mid-write can never leave a half-written cache behind
+    (os.replace is atomic on both POSIX and Windows).
+
+    Failing to write the cache (e.g., read-only checkout) is harmless -
+    we just parse YAML again next time.
+
+    Args:
+        cache_key: Key from _config_cache_key()
+        config: Merged configuration to cache
+    """
+    cache_path = get_config_cache_path()
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(cache_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
 
 
 def _deep_merge(base: dict, overlay: dict) -> dict:
@@ -172,19 +294,28 @@ def _deep_merge(base: dict, overlay: dict) -> dict:
     - Nested dicts are merged recursively
     - Lists and other values are replaced entirely
 
+    Only the parts of base that overlay actually touches are copied.
+    Users typically override two or three keys, so every other section
+    is shared by reference with base instead of being cloned. That's safe
+    because nothing mutates the config after loading (see get()).
+
+    Syntax notes:
+    - {**base} unpacks base into a new dict (a shallow copy)
+
     Args:
         base: Base configuration (defaults)
         overlay: User configuration to merge in
 
     Returns:
-        Merged configuration
+        Merged configuration (neither input is modified)
     """
-    result = _deep_copy(base)
+    result = {**base}
 
     for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            # Both are dicts - merge recursively
-            result[key] = _deep_merge(result[key], value)
+        base_value = result.get(key)
+        if type(base_value) is dict and type(value) is dict:
+            # Both are dicts - merge recursively (this copies just that section)
+            result[key] = _deep_merge(base_value, value)
         else:
             # Replace the value
             result[key] = value
@@ -196,40 +327,113 @@ def _deep_merge(base: dict, overlay: dict) -> dict:
 # Config Access Helpers
 # ---------------------------------------------------------------------------
 
+class Paths(NamedTuple):
+    """
+    Every configured directory, expanded to a full Path.
+
+    Built once when the config is loaded (see get_config()), so the
+    get_*_path() helpers below are just attribute lookups rather than
+    re-expanding (and re-stat'ing) the same strings on every call.
+
+    Syntax notes:
+    - NamedTuple gives an immutable tuple with named fields (paths.journal)
+    - Immutable means callers can't accidentally change the shared copy
+    """
+
+    journal: Path
+    entries: Path
+    summaries: Path
+    staging: Path
+    secrets_base: Path
+    shared_secrets: Path
+    project_secrets: Path
+
+
 # Global config cache - loaded once, reused
 _config_cache: dict | None = None
 
+# Paths derived from _config_cache - built alongside it, reset alongside it
+_paths_cache: Paths | None = None
+
 
 def get_config() -> dict:
     """
     Get the configuration, loading it if necessary.
 
     Uses a module-level cache so we only parse YAML once.
+    The expanded directory paths are computed at the same time.
 
     Returns:
         Configuration dictionary
     """
-    global _config_cache
+    global _config_cache, _paths_cache
     if _config_cache is None:
-        _config_cache = load_config()
+        # Build both into locals first, then publish them - paths first,
+        # since a non-None _config_cache is what tells other callers (and
+        # get_paths()) that loading is done. No caller can ever see a
+        # loaded config with missing paths.
+        config = load_config()
+        paths = _build_paths(config)
+        _paths_cache = paths
+        _config_cache = config
     return _config_cache
 
 
+def get_paths() -> Paths:
+    """
+    Get the expanded directory paths, loading the config if necessary.
+
+    Returns:
+        Paths with every configured directory
+    """
+    get_config()
+    return _paths_cache
+
+
+def reset_config() -> None:
+    """
+    Forget the loaded configuration so the next access reloads it.
+
+    Clears the config dict cache, the derived paths, and the memoized
+    get() results together so they can never disagree.
+    Mostly useful for tests that swap in a different config.yaml.
+    """
+    global _config_cache, _paths_cache
+    _config_cache = None
+    _paths_cache = None
+    get.cache_clear()
+
+
+# Split form of every key_path seen so far: "email.to" -> ("email", "to")
+# get() is memoized per (key_path, default), but the same path is often asked
+# for with different defaults, so we also avoid re-splitting on those misses.
+_KEY_PATH_CACHE: dict[str, tuple[str, ...]] = {}
+
+
+@functools.lru_cache(maxsize=256)
 def get(key_path: str, default: Any = None) -> Any:
     """
     Get a config value using dot-notation path.
 
     This is a convenience function for accessing nested values.
 
+    Results are memoized per (key_path, default), since the path helpers
+    below call this for the same handful of keys over and over. The config
+    never changes after loading (see reset_config() for tests), so a cached
+    answer is always current. This means:
+    - default must be hashable (strings, numbers, None are all fine)
+    - don't mutate a returned dict/list - it's shared with later callers
+
     Examples:
         get("email.to")  # Returns "sean@das.llc"
-        get("anthropic.summary_model")  # Returns "claude-sonnet-4-20250514"
+        get("anthropic.summary_model")  # Returns "claude-haiku-4-5"
         get("nonexistent.key", "fallback")  # Returns "fallback"
 
     Syntax notes:
-    - .split(".") breaks "a.b.c" into ["a", "b", "c"]
+    - .split(".") breaks "a.b.c" into ["a", "b", "c"] (done once per path)
     - We traverse the dict using each key in sequence
     - If any key is missing, we return the default
+    - @functools.lru_cache remembers return values keyed on the arguments
 
     Args:
         key_path: Dot-separated path like "email.to" or "anthropic.model"
@@ -238,8 +442,14 @@ def get(key_path: str, default: Any = None) -> Any:
     Returns:
         The config value, or default if not found
     """
-    config = get_config()
-    keys = key_path.split(".")
+    return _lookup(get_config(), key_path, default)
+
+
+def _lookup(config: dict, key_path: str, default: Any = None) -> Any:
+    """Walk a config dict along a dot-separated path (see get())."""
+    keys = _KEY_PATH_CACHE.get(key_path)
+    if keys is None:
+        keys = _KEY_PATH_CACHE[key_path] = tuple(key_path.split("."))
 
     value = config
     for key in keys:
@@ -263,48 +473,83 @@ def expand_path(path_str: str) -> Path:
     - ~ expansion (home directory)
     - Converts to absolute path
 
+    Symlinks are deliberately left alone: none of our callers need them
+    resolved, and unlike Path.resolve() this never touches the filesystem.
+
+    Syntax notes:
+    - os.path.expanduser() replaces a leading ~ with the home directory
+    - os.path.abspath() joins relative paths onto the current directory
+      and normalizes any "..", purely as string operations
+
     Args:
         path_str: Path string, possibly with ~ prefix
 
     Returns:
         Expanded Path object
     """
-    return Path(path_str).expanduser().resolve()
+    return Path(os.path.abspath(os.path.expanduser(path_str)))
+
+
+def _build_paths(config: dict) -> Paths:
+    """
+    Expand every configured directory into a Path.
+
+    Called once from get_config(), before the config is published, so it
+    reads the dict it's given rather than going through get(). Everything
+    else should use get_paths() or the get_*_path() helpers below.
+
+    Args:
+        config: The freshly loaded configuration dictionary
+
+    Returns:
+        Paths built from that config
+    """
+    journal = expand_path(_lookup(config, "journal.path"))
+    secrets_base = expand_path(_lookup(config, "secrets.base_path"))
+    return Paths(
+        journal=journal,
+        entries=journal / _lookup(config, "journal.entries_subfolder", "daily-entries"),
+        summaries=journal / _lookup(config, "journal.summaries_subfolder", "periodic-summaries"),
+        staging=journal / _lookup(config, "journal.staging_subfolder", "daily-staging"),
+        secrets_base=secrets_base,
+        shared_secrets=secrets_base / _lookup(config, "secrets.shared_folder"),
+        project_secrets=secrets_base / _lookup(config, "secrets.project_folder"),
+    )
 
 
 def get_journal_path() -> Path:
     """Get the configured journal path as a Path object."""
-    return expand_path(get("journal.path"))
+    return get_paths().journal
 
 
 def get_entries_path() -> Path:
     """Get the path to daily journal entries (daily-entries/)."""
-    return get_journal_path() / get("journal.entries_subfolder", "daily-entries")
+    return get_paths().entries
 
 
 def get_summaries_path() -> Path:
     """Get the path to periodic summaries (periodic-summaries/)."""
-    return get_journal_path() / get("journal.summaries_subfolder", "periodic-summaries")
+    return get_paths().summaries
 
 
 def get_staging_path() -> Path:
     """Get the path to checkpoint staging (daily-staging/)."""
-    return get_journal_path() / get("journal.staging_subfolder", "daily-staging")
+    return get_paths().staging
 
 
 def get_secrets_base_path() -> Path:
     """Get the base secrets path (~/.secrets)."""
-    return expand_path(get("secrets.base_path"))
+    return get_paths().secrets_base
 
 
 def get_shared_secrets_path() -> Path:
     """Get the shared secrets path (~/.secrets/shared/)."""
-    return get_secrets_base_path() / get("secrets.shared_folder")
+    return get_paths().shared_secrets
 
 
 def get_project_secrets_path() -> Path:
     """Get this project's secrets path (~/.secrets/smart-pigeon/)."""
-    return get_secrets_base_path() / get("secrets.project_folder")
+    return get_paths().project_secrets
 
 
 # ---------------------------------------------------------------------------
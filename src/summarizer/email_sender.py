@@ -21,17 +21,26 @@ Why OAuth instead of password?
     - Apps only get the scopes they request (we only ask for "send email")
 """
 
+# Makes all type hints strings, so `Credentials | None` below doesn't need
+# the Google libraries imported at runtime (see TYPE_CHECKING block)
+from __future__ import annotations
+
 import base64  # For encoding email content (Gmail API requires base64)
 from email.message import EmailMessage  # Standard library for constructing emails (modern API)
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Google API libraries - installed via: uv add google-auth-oauthlib google-api-python-client
-# These are the official Google libraries for OAuth and API access
-from google.auth.transport.requests import Request  # For refreshing expired tokens
-from google.oauth2.credentials import Credentials  # Represents the user's tokens
-from google_auth_oauthlib.flow import InstalledAppFlow  # Handles the OAuth dance
-from googleapiclient.discovery import build  # Creates API client objects
-from googleapiclient.errors import HttpError  # Gmail API error handling
+# These are the official Google libraries for OAuth and API access.
+#
+# They're slow to import (hundreds of ms), so the functions that need them
+# import them locally. That keeps `--help`, `--dry-run`, and anything else
+# that never touches Gmail from paying for them.
+#
+# TYPE_CHECKING is False at runtime and True for type checkers, so this
+# import only exists for editors/mypy reading the Credentials type hint.
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 # Import our config system for email addresses and paths
 from . import config
@@ -149,6 +158,10 @@ def get_gmail_credentials() -> Credentials | None:
     Returns:
         Credentials object ready for API calls, or None if auth failed/unavailable.
     """
+    from google.auth.transport.requests import Request  # For refreshing expired tokens
+    from google.oauth2.credentials import Credentials  # Represents the user's tokens
+    from google_auth_oauthlib.flow import InstalledAppFlow  # Handles the OAuth dance
+
     creds = None
     token_path = get_token_path()
     client_secret_path = get_client_secret_path()
@@ -199,10 +212,74 @@ def get_gmail_credentials() -> Credentials | None:
     return creds
 
 
+# ---------------------------------------------------------------------------
+# Gmail Service
+# ---------------------------------------------------------------------------
+
+# The Gmail API client built for the current credentials, reused across calls.
+# build() parses Gmail's discovery document and constructs a whole resource
+# tree, which is wasted work when one run sends several emails or checks
+# replies and then sends confirmations. Stored as (creds, service).
+_gmail_service_cache: tuple[Credentials, Any] | None = None
+
+
+def get_gmail_service() -> Any | None:
+    """
+    Get a Gmail API client, building it only when needed.
+
+    The client is cached together with the credentials it was built from.
+    As long as those credentials are still valid we hand back the same
+    client; otherwise we get fresh credentials (refreshing or re-authing
+    as needed, see get_gmail_credentials()) and build a new one.
+
+    Syntax notes:
+    - `global` lets us reassign a module-level variable from inside a function
+    - build() returns a dynamically generated object, hence the `Any` hint
+
+    Returns:
+        Gmail API client, or None if credentials are unavailable.
+    """
+    from googleapiclient.discovery import build  # Creates API client objects
+
+    global _gmail_service_cache
+    if _gmail_service_cache is not None:
+        cached_creds, service = _gmail_service_cache
+        if cached_creds.valid:
+            return service
+
+    # Get authenticated credentials (may trigger browser auth on first run)
+    creds = get_gmail_credentials()
+    if not creds:
+        _gmail_service_cache = None
+        return None
+
+    # build() creates an API client for a specific Google service
+    # "gmail" is the service name, "v1" is the API version
+    # credentials=creds attaches our OAuth tokens
+    # static_discovery=True uses the Gmail discovery document bundled with the
+    # library instead of downloading it; cache_discovery=False skips probing
+    # for an on-disk discovery cache (which we'd never hit, and which logs a
+    # "file_cache is only supported with oauth2client<4.0.0" warning)
+    service = build(
+        "gmail", "v1", credentials=creds, static_discovery=True, cache_discovery=False
+    )
+    _gmail_service_cache = (creds, service)
+    return service
+
+
 # ---------------------------------------------------------------------------
 # Email Sending
 # ---------------------------------------------------------------------------
 
+# Bound once so create_message() skips the module attribute lookup per send.
+#
+# We deliberately build a fresh EmailMessage per send rather than cloning a
+# pre-filled "template" message: copy.copy() would share the template's
+# internal header list (so headers would leak between messages), and
+# copy.deepcopy() costs more than just setting three headers.
+_b64encode = base64.urlsafe_b64encode
+
+
 def create_message(to: str, subject: str, body: str, from_addr: str) -> dict:
     """
     Create an email message in the format Gmail API expects.
@@ -246,7 +323,7 @@ def create_message(to: str, subject: str, body: str, from_addr: str) -> dict:
     # Gmail API expects the message as a base64url-encoded string
     # .as_bytes() gives us the full RFC 2822 message as bytes
     # urlsafe_b64encode handles the encoding (uses - and _ instead of + and /)
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    raw = _b64encode(message.as_bytes()).decode("utf-8")
 
     return {"raw": raw}
 
@@ -275,22 +352,19 @@ def send_email(to: str, subject: str, body: str, from_addr: str | None = None) -
         ... )
         True
     """
+    from googleapiclient.errors import HttpError  # Gmail API error handling
+
     # Use config value if from_addr not explicitly provided
     if from_addr is None:
         from_addr = config.get("email.from")
 
-    # Get authenticated credentials (may trigger browser auth on first run)
-    creds = get_gmail_credentials()
-    if not creds:
+    # Get the (possibly cached) Gmail client
+    service = get_gmail_service()
+    if not service:
         print("Failed to get Gmail credentials. Email not sent.")
         return False
 
     try:
-        # build() creates an API client for a specific Google service
-        # "gmail" is the service name, "v1" is the API version
-        # credentials=creds attaches our OAuth tokens
-        service = build("gmail", "v1", credentials=creds)
-
         # Create the message in Gmail's expected format
         message = create_message(to, subject, body, from_addr)
 
@@ -310,6 +384,68 @@ def send_email(to: str, subject: str, body: str, from_addr: str | None = None) -
         return False
 
 
+def send_emails_batch(messages: list[tuple[str, str, str, str]]) -> list[bool]:
+    """
+    Send several emails in a single Gmail API batch request.
+
+    send_email() makes one HTTP round-trip per email. A batch request
+    bundles all the sends into one multipart HTTP request, so sending N
+    emails costs roughly one round-trip instead of N.
+
+    Each email succeeds or fails on its own - one bad recipient doesn't
+    stop the rest of the batch.
+
+    Syntax notes:
+    - new_batch_http_request(callback=...) collects requests to send together
+    - batch.add(request, request_id=...) queues a request without executing it
+    - The callback runs once per request with (request_id, response, exception)
+    - The nested callback can update `results` in place (no `nonlocal` needed,
+      since we modify the list rather than reassign the name)
+
+    Args:
+        messages: List of (to, subject, body, from_addr) tuples
+
+    Returns:
+        List of booleans, one per message in the same order:
+        True if that email was sent successfully, False otherwise.
+    """
+    from googleapiclient.errors import HttpError  # Gmail API error handling
+
+    if not messages:
+        return []
+
+    results = [False] * len(messages)
+
+    service = get_gmail_service()
+    if not service:
+        print("Failed to get Gmail credentials. Emails not sent.")
+        return results
+
+    def on_response(request_id: str, response: dict, exception: Exception | None) -> None:
+        # request_id is the message's index (as a string) from batch.add() below
+        if exception is not None:
+            print(f"Gmail API error: {exception}")
+            return
+        results[int(request_id)] = True
+        print(f"Email sent successfully! Message ID: {response['id']}")
+
+    batch = service.new_batch_http_request(callback=on_response)
+    for i, (to, subject, body, from_addr) in enumerate(messages):
+        message = create_message(to, subject, body, from_addr)
+        batch.add(
+            service.users().messages().send(userId="me", body=message),
+            request_id=str(i),
+        )
+
+    try:
+        batch.execute()
+    except HttpError as error:
+        # The batch request itself failed (per-email errors go to the callback)
+        print(f"Gmail API error: {error}")
+
+    return results
+
+
 def send_summary_email(summary: str, date_range: str) -> bool:
     """
     Send a work journal summary email.
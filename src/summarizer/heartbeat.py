@@ -19,15 +19,39 @@ Why fetch facts from Wikipedia instead of generating them:
 - Fetching from a real API ensures verifiable, accurate facts
 """
 
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
 
-import anthropic
 import requests  # For fetching Wikipedia API
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# lxml (libxml2, written in C) parses much faster than the pure-Python
+# ElementTree, but it isn't a required dependency. Both provide the same
+# XMLPullParser API we use below, so fall back to the standard library.
+try:
+    from lxml import etree as _xml
+except ImportError:
+    import xml.etree.ElementTree as _xml
 
 from . import config
 from .email_sender import send_email
+from .journal import read_file_text
+from .summarize import get_anthropic_client
+
+
+# Checkpoint filename pattern: YYYY-MM-DD-checkpoints.md (compiled once at import)
+_CHECKPOINT_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-checkpoints\.md$")
+
+
+# Most stale checkpoint days handled in one heartbeat run. Normally there's
+# zero or one (yesterday); this just bounds the work (and Claude calls) if
+# the heartbeat hasn't run for a long while.
+_MAX_STALE_DATES = 7
 
 
 def get_yesterday() -> date:
@@ -39,7 +63,12 @@ def check_stale_staging(staging_path: Path | None = None) -> list[date]:
     """
     Check for stale checkpoint files in daily-staging/.
 
-    Returns list of dates that have stale checkpoints (not today).
+    Returns list of dates that have stale checkpoints (not today), oldest
+    first - the most recent _MAX_STALE_DATES of them.
+
+    Every file is looked at before capping: the directory listing comes
+    back in no particular order, so stopping early would keep an arbitrary
+    handful of dates rather than the latest ones.
     """
     if staging_path is None:
         staging_path = config.get_staging_path()
@@ -50,17 +79,23 @@ def check_stale_staging(staging_path: Path | None = None) -> list[date]:
     stale_dates = []
     today = date.today()
 
-    # Pattern: YYYY-MM-DD-checkpoints.md
-    checkpoint_pattern = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-checkpoints\.md$")
-
-    for file in staging_path.iterdir():
-        match = checkpoint_pattern.match(file.name)
-        if match:
-            file_date = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            if file_date < today:
-                stale_dates.append(file_date)
-
-    return sorted(stale_dates)
+    # os.scandir() lists names without building a Path per file
+    with os.scandir(staging_path) as it:
+        for entry in it:
+            # Skip subdirectories etc. is_file() uses the file type the
+            # directory listing already gave us, so it costs no extra stat
+            # (except for symlinks, which it follows)
+            if not entry.is_file():
+                continue
+            match = _CHECKPOINT_RE.match(entry.name)
+            if match:
+                file_date = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+                if file_date < today:
+                    stale_dates.append(file_date)
+
+    # Safety cap - any older leftovers get picked up on later runs
+    # [-N:] is the last N items of the sorted list, i.e. the newest dates
+    return sorted(stale_dates)[-_MAX_STALE_DATES:]
 
 
 def read_checkpoint_file(checkpoint_date: date, staging_path: Path | None = None) -> str | None:
@@ -71,9 +106,12 @@ def read_checkpoint_file(checkpoint_date: date, staging_path: Path | None = None
     filename = f"{checkpoint_date.isoformat()}-checkpoints.md"
     filepath = staging_path / filename
 
-    if filepath.exists():
-        return filepath.read_text()
-    return None
+    # Just try the read - a missing file is the only "not there" case,
+    # and this saves a separate exists() check
+    try:
+        return read_file_text(filepath)
+    except FileNotFoundError:
+        return None
 
 
 def read_journal_entry(entry_date: date, entries_path: Path | None = None) -> str | None:
@@ -84,9 +122,10 @@ def read_journal_entry(entry_date: date, entries_path: Path | None = None) -> st
     filename = f"{entry_date.isoformat()}.md"
     filepath = entries_path / filename
 
-    if filepath.exists():
-        return filepath.read_text()
-    return None
+    try:
+        return read_file_text(filepath)
+    except FileNotFoundError:
+        return None
 
 
 def synthesize_journal_from_checkpoints(checkpoint_content: str, target_date: date) -> str:
@@ -96,9 +135,7 @@ def synthesize_journal_from_checkpoints(checkpoint_content: str, target_date: da
     This is a simplified auto-wrapup that creates a basic journal entry
     from checkpoint files when no manual wrap-up was done.
     """
-    api_key_path = config.get_shared_secrets_path() / "anthropic-api-key.txt"
-    api_key = api_key_path.read_text().strip()
-    client = anthropic.Anthropic(api_key=api_key)
+    client = get_anthropic_client()
 
     prompt = f"""Please synthesize these checkpoint notes from {target_date.isoformat()} into a concise work journal entry.
 
@@ -124,25 +161,94 @@ Here are the checkpoint notes to synthesize:
 
 Create a concise journal entry. Focus on what was accomplished, not process details. If multiple sessions are evident from time gaps, create multiple session sections."""
 
-    message = client.messages.create(
-        model=config.get("anthropic.summary_model"),
+    # Stream the response and join the text chunks as they arrive
+    # (stream.text_stream yields just the text pieces, no event objects)
+    with client.messages.stream(
+        model=config.get("anthropic.heartbeat_model"),
         max_tokens=2000,
         messages=[{"role": "user", "content": prompt}],
-    )
+    ) as stream:
+        return "".join(stream.text_stream)
+
 
-    return message.content[0].text
+# Checkpoint notes shorter than this (and with no "---" session breaks) are
+# formatted locally instead of sent to Claude - there's nothing to synthesize
+_LOCAL_WRAPUP_MAX_CHARS = 800
 
+# A markdown heading: one or more "#", a space, then the heading text
+# Group 1 is the "#"s (their count is the level), group 2 the text
+_HEADING_RE = re.compile(r"^(#+)\s+(.*)$")
+
+
+def is_simple_checkpoint(checkpoint_content: str) -> bool:
+    """
+    Check whether checkpoint notes are short enough to format without Claude.
 
-def auto_wrapup(target_date: date) -> bool:
+    "Simple" means one session (no "---" separator lines) and under
+    _LOCAL_WRAPUP_MAX_CHARS characters.
+    """
+    if len(checkpoint_content) >= _LOCAL_WRAPUP_MAX_CHARS:
+        return False
+    return not any(line.strip() == "---" for line in checkpoint_content.splitlines())
+
+
+def format_journal_from_checkpoints(checkpoint_content: str, target_date: date) -> str:
+    """
+    Format short checkpoint notes into a journal entry, without calling Claude.
+
+    Produces the same structure the synthesis prompt asks for, with each
+    checkpoint line as a bullet. Used for the common "a few quick notes"
+    case, where an API round-trip adds cost and latency but no value.
+
+    A top-level title (e.g. "# Checkpoints") is dropped - the entry has its
+    own. Lower-level headings ("## Fixed login bug") are often the note
+    itself, so their text is kept as a bullet.
+    """
+    bullets = []
+    for line in checkpoint_content.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        heading = _HEADING_RE.match(line)
+        if heading:
+            # len(heading.group(1)) is the number of "#"s, i.e. the level
+            if len(heading.group(1)) == 1:
+                continue
+            line = heading.group(2)
+        # Normalize existing list markers so we don't get "- - item"
+        if line.startswith(("- ", "* ")):
+            line = line[2:]
+        bullets.append(f"- {line}")
+
+    bullets_text = "\n".join(bullets) if bullets else "- (empty checkpoint notes)"
+
+    return f"""# Work Journal: {target_date.isoformat()}
+
+## Session 1: Checkpoints
+
+### What Was Worked On
+{bullets_text}
+
+### Current Status
+Auto-wrapped from checkpoint notes (no manual wrap-up was done).
+"""
+
+
+def auto_wrapup(target_date: date) -> str | None:
     """
     Run automatic wrap-up for a specific date.
 
     1. Read checkpoint file
-    2. Synthesize into journal entry
+    2. Synthesize into journal entry (locally if the notes are short)
     3. Write journal entry
     4. Clear checkpoint file
 
-    Returns True if successful, False if no checkpoints found.
+    The entries directory must already exist - run_heartbeat() creates it
+    once up front rather than on every call.
+
+    Returns the journal entry content on success (whether we just wrote it
+    or it already existed), or None if no checkpoints were found. Handing
+    back the content saves the caller re-reading the file we just wrote.
     """
     staging_path = config.get_staging_path()
     entries_path = config.get_entries_path()
@@ -150,7 +256,7 @@ def auto_wrapup(target_date: date) -> bool:
     # Read checkpoints
     checkpoint_content = read_checkpoint_file(target_date, staging_path)
     if not checkpoint_content:
-        return False
+        return None
 
     # Check if journal already exists (don't overwrite)
     existing_journal = read_journal_entry(target_date, entries_path)
@@ -158,21 +264,27 @@ def auto_wrapup(target_date: date) -> bool:
         # Journal exists, just clear the stale checkpoint
         checkpoint_file = staging_path / f"{target_date.isoformat()}-checkpoints.md"
         checkpoint_file.unlink()
-        return True
+        return existing_journal
 
-    # Synthesize journal entry
-    journal_content = synthesize_journal_from_checkpoints(checkpoint_content, target_date)
+    # Synthesize journal entry (short single-session notes don't need Claude)
+    if is_simple_checkpoint(checkpoint_content):
+        journal_content = format_journal_from_checkpoints(checkpoint_content, target_date)
+    else:
+        journal_content = synthesize_journal_from_checkpoints(checkpoint_content, target_date)
 
     # Write journal entry
-    entries_path.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file, then rename it into place: os.replace() is atomic,
+    # so a crash mid-write can never leave a half-written journal entry
     journal_file = entries_path / f"{target_date.isoformat()}.md"
-    journal_file.write_text(journal_content)
+    tmp_file = journal_file.with_suffix(".md.tmp")
+    tmp_file.write_text(journal_content)
+    os.replace(tmp_file, journal_file)
 
     # Clear checkpoint file
     checkpoint_file = staging_path / f"{target_date.isoformat()}-checkpoints.md"
     checkpoint_file.unlink()
 
-    return True
+    return journal_content
 
 
 # ---------------------------------------------------------------------------
@@ -189,32 +301,88 @@ NEWS_FEEDS = {
 }
 
 
-def fetch_rss_headlines(feed_url: str, max_items: int = 3) -> list[dict]:
+# One HTTP session shared by every feed fetch (including the concurrent ones).
+# A Session keeps connections open between requests, so repeat requests to
+# the same host skip the TCP + TLS handshake. The adapter also retries
+# transient server errors a couple of times with a short backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+    ),
+)
+
+
+# ---------------------------------------------------------------------------
+# RSS Conditional-GET Cache
+# ---------------------------------------------------------------------------
+
+# Feeds send ETag / Last-Modified headers identifying the version we got.
+# If we send them back (If-None-Match / If-Modified-Since), the server can
+# answer "304 Not Modified" with an empty body instead of the whole feed,
+# and we reuse the headlines we parsed last time.
+#
+# Cache format: {feed_url: {"etag": ..., "last_modified": ..., "headlines": [...]}}
+
+
+def get_rss_cache_path() -> Path:
+    """Path to the RSS conditional-GET cache (~/.cache/work-journal-summarizer/)."""
+    return Path.home() / ".cache" / "work-journal-summarizer" / "rss_cache.json"
+
+
+def load_rss_cache() -> dict:
+    """Load the RSS cache, or an empty one if missing or unreadable."""
+    try:
+        return json.loads(get_rss_cache_path().read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_rss_cache(cache: dict) -> None:
+    """Save the RSS cache. Failure just means a full fetch next time."""
+    cache_path = get_rss_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2))
+    except OSError as e:
+        print(f"  Warning: Failed to save RSS cache: {e}")
+
+
+# How many bytes of feed XML to hand the parser at a time
+_RSS_PARSE_CHUNK = 16 * 1024
+
+
+def parse_rss_items(content: bytes, max_items: int) -> list[dict]:
     """
-    Fetch headlines from an RSS feed.
+    Extract headlines from the first max_items <item>s of an RSS feed.
+
+    Instead of building a tree for the whole feed and then searching it,
+    we feed the XML to a pull parser a chunk at a time and stop as soon
+    as max_items items have been seen. We only want the first few items,
+    so most of a long feed is never parsed at all.
+
+    Syntax notes:
+    - XMLPullParser(events=("end",)) reports each element once its closing
+      tag has been parsed, i.e. when all its children are available
+    - .feed() accepts partial XML; .read_events() returns what's complete so far
 
     Returns list of dicts with 'title' and 'link' keys.
     """
-    import xml.etree.ElementTree as ET
+    parser = _xml.XMLPullParser(events=("end",))
+    headlines = []
+    items_seen = 0
 
-    try:
-        # Follow redirects, set timeout, add user agent
-        response = requests.get(
-            feed_url,
-            timeout=10,
-            allow_redirects=True,
-            headers={"User-Agent": "WorkContinuityBot/1.0"}
-        )
-        response.raise_for_status()
-
-        # Parse XML
-        root = ET.fromstring(response.content)
+    for start in range(0, len(content), _RSS_PARSE_CHUNK):
+        parser.feed(content[start:start + _RSS_PARSE_CHUNK])
 
         # RSS feeds have items under channel/item
-        items = root.findall(".//item")[:max_items]
+        for _event, item in parser.read_events():
+            if item.tag != "item":
+                continue
 
-        headlines = []
-        for item in items:
             title_elem = item.find("title")
             link_elem = item.find("link")
 
@@ -225,6 +393,65 @@ def fetch_rss_headlines(feed_url: str, max_items: int = 3) -> list[dict]:
 
                 headlines.append({"title": title, "link": link})
 
+            # We've copied out the strings we need; drop the item's children
+            # so the partial tree doesn't keep growing as we parse
+            item.clear()
+
+            items_seen += 1
+            if items_seen >= max_items:
+                # Early exit - the rest of the feed is never parsed
+                return headlines
+
+    # Fewer than max_items items; close() raises if the XML was malformed
+    parser.close()
+    return headlines
+
+
+def fetch_rss_headlines(feed_url: str, max_items: int = 3, cache: dict | None = None) -> list[dict]:
+    """
+    Fetch headlines from an RSS feed.
+
+    If a cache dict is passed (see load_rss_cache()), the request is made
+    conditional on the feed having changed, and the cache entry for this
+    feed_url is updated in place. Different feeds use different keys, so
+    concurrent calls can safely share one cache dict.
+
+    Returns list of dicts with 'title' and 'link' keys.
+    """
+    cached = cache.get(feed_url) if cache is not None else None
+
+    # Follow redirects, set timeout, add user agent
+    headers = {"User-Agent": "WorkContinuityBot/1.0"}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = _SESSION.get(
+            feed_url,
+            timeout=10,
+            allow_redirects=True,
+            headers=headers,
+        )
+
+        # 304 = unchanged since last time; skip download + parse entirely
+        if response.status_code == 304 and cached:
+            return cached["headlines"][:max_items]
+
+        response.raise_for_status()
+
+        # Parse XML (stops as soon as we have max_items items)
+        headlines = parse_rss_items(response.content, max_items)
+
+        if cache is not None:
+            cache[feed_url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "headlines": headlines,
+            }
+
         return headlines
 
     except Exception as e:
@@ -236,13 +463,30 @@ def fetch_all_headlines() -> dict[str, list[dict]]:
     """
     Fetch headlines from all configured news sources.
 
+    Feeds are fetched concurrently: each fetch is almost entirely waiting on
+    the network, so threads let us wait on all of them at once. Total time
+    is the slowest feed (capped by its 10s timeout) instead of the sum.
+
     Returns dict mapping source name to list of headlines.
     """
     all_headlines = {}
-
-    for source_name, feed_url in NEWS_FEEDS.items():
-        print(f"  Fetching {source_name}...")
-        headlines = fetch_rss_headlines(feed_url, max_items=3)
+    rss_cache = load_rss_cache()
+
+    print(f"  Fetching {', '.join(NEWS_FEEDS)}...")
+    with ThreadPoolExecutor(max_workers=len(NEWS_FEEDS)) as executor:
+        # Start every fetch now; results are collected below in NEWS_FEEDS order
+        futures = {
+            source_name: executor.submit(fetch_rss_headlines, feed_url, max_items=3, cache=rss_cache)
+            for source_name, feed_url in NEWS_FEEDS.items()
+        }
+
+    # All fetches are done (leaving the `with` block waits for them)
+    save_rss_cache(rss_cache)
+
+    for source_name, future in futures.items():
+        # fetch_rss_headlines() never raises (it returns [] on failure)
+        headlines = future.result()
+        print(f"  {source_name}:")
         if headlines:
             all_headlines[source_name] = headlines
             print(f"    Got {len(headlines)} headlines")
@@ -262,15 +506,15 @@ def synthesize_news_vibe(headlines: dict[str, list[dict]]) -> str:
         return "📰 *News feeds unavailable today*"
 
     # Build the headlines text
-    headlines_text = ""
+    # Collect pieces in a list and join once at the end - each `+=` on a
+    # string would copy everything built so far
+    parts = []
     for source, items in headlines.items():
-        headlines_text += f"\n**{source}:**\n"
-        for item in items:
-            headlines_text += f"- {item['title']}\n"
+        parts.append(f"\n**{source}:**\n")
+        parts.extend(f"- {item['title']}\n" for item in items)
+    headlines_text = "".join(parts)
 
-    api_key_path = config.get_shared_secrets_path() / "anthropic-api-key.txt"
-    api_key = api_key_path.read_text().strip()
-    client = anthropic.Anthropic(api_key=api_key)
+    client = get_anthropic_client()
 
     prompt = f"""Here are today's headlines from several news sources:
 
@@ -289,21 +533,23 @@ Example output style:
 "Feels like a tech-heavy news day with AI chips and e-commerce regulation dominating the Asia coverage. Europe is dealing with political fallout from [topic]. Meanwhile in the US, [topic]. The headline that caught my eye: '[specific headline]' (Source)"
 """
 
-    message = client.messages.create(
-        model=config.get("anthropic.summary_model"),  # Use Sonnet for quality
+    # Streaming: entering the `with` sends the request, and the text arrives
+    # while we iterate. Claude is generating while we build the links section,
+    # so that local work overlaps the wait instead of adding to it.
+    with client.messages.stream(
+        model=config.get("anthropic.heartbeat_model"),  # Haiku - short, simple task
         max_tokens=300,
         messages=[{"role": "user", "content": prompt}],
-    )
-
-    # Build the full section with links for verification
-    vibe = message.content[0].text.strip()
+    ) as stream:
+        # Add the raw headlines with links for reference (verification)
+        link_parts = ["\n\n**Headlines sourced from:**\n"]
+        for source, items in headlines.items():
+            links = ", ".join([f"[{i+1}]({item['link']})" for i, item in enumerate(items) if item['link']])
+            link_parts.append(f"- {source}: {links}\n")
+        links_section = "".join(link_parts)
 
-    # Add the raw headlines with links for reference
-    links_section = "\n\n**Headlines sourced from:**\n"
-    for source, items in headlines.items():
-        links_section += f"- {source}: "
-        links_section += ", ".join([f"[{i+1}]({item['link']})" for i, item in enumerate(items) if item['link']])
-        links_section += "\n"
+        # Build the full section: the vibe text, then the links
+        vibe = "".join(stream.text_stream).strip()
 
     return vibe + links_section
 
@@ -379,6 +625,24 @@ def send_heartbeat_email(subject: str, body: str) -> bool:
     )
 
 
+def get_news_vibe() -> str:
+    """
+    Fetch today's headlines and synthesize the news vibe section.
+
+    Never raises: if anything goes wrong, returns a short "unavailable"
+    note so the heartbeat email still goes out.
+    """
+    try:
+        headlines = fetch_all_headlines()
+        print("Synthesizing news vibe...")
+        news_vibe = synthesize_news_vibe(headlines)
+        print(f"News vibe: {news_vibe[:80]}...")
+        return news_vibe
+    except Exception as e:
+        print(f"Error fetching/synthesizing news: {e}")
+        return "📰 *News unavailable today - feeds may be down*"
+
+
 def run_heartbeat() -> int:
     """
     Main heartbeat function. Called at 1am daily.
@@ -390,42 +654,51 @@ def run_heartbeat() -> int:
     print(f"Running daily heartbeat for {date.today().isoformat()}...")
     print(f"Checking work from {yesterday.isoformat()}...")
 
-    # Step 1: Check for stale checkpoints
-    stale_dates = check_stale_staging()
-    auto_wrapup_ran = False
-
-    if stale_dates:
-        print(f"Found stale checkpoints for: {[d.isoformat() for d in stale_dates]}")
-
-        # Process each stale date (usually just yesterday)
-        for stale_date in stale_dates:
-            print(f"  Running auto-wrapup for {stale_date.isoformat()}...")
-            if auto_wrapup(stale_date):
-                print(f"  ✓ Auto-wrapup complete for {stale_date.isoformat()}")
-                if stale_date == yesterday:
-                    auto_wrapup_ran = True
-            else:
-                print(f"  ✗ No checkpoints found for {stale_date.isoformat()}")
-    else:
-        print("No stale checkpoints found.")
-
-    # Step 2: Read yesterday's journal (may have just been created)
-    journal_content = read_journal_entry(yesterday)
-    if journal_content:
-        print(f"Found journal entry for {yesterday.isoformat()} ({len(journal_content):,} chars)")
-    else:
-        print(f"No journal entry found for {yesterday.isoformat()}")
+    # The news section (step 3: RSS fetch + Claude "vibe" call) doesn't depend
+    # on steps 1-2, and both sides spend most of their time waiting on the
+    # network (feeds + Claude vs. the Claude call in auto-wrapup). Run the
+    # whole news pipeline in a background thread so the two overlap; we
+    # collect the result when we get to step 3.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        print("Fetching news headlines (in background)...")
+        news_vibe_future = executor.submit(get_news_vibe)
+
+        # Step 1: Check for stale checkpoints
+        stale_dates = check_stale_staging()
+        auto_wrapup_ran = False
+        journal_content = None
+
+        if stale_dates:
+            print(f"Found stale checkpoints for: {[d.isoformat() for d in stale_dates]}")
+
+            # auto_wrapup() writes into daily-entries/; make sure it exists once
+            config.get_entries_path().mkdir(parents=True, exist_ok=True)
+
+            # Process each stale date (usually just yesterday)
+            for stale_date in stale_dates:
+                print(f"  Running auto-wrapup for {stale_date.isoformat()}...")
+                wrapped_content = auto_wrapup(stale_date)
+                if wrapped_content is not None:
+                    print(f"  ✓ Auto-wrapup complete for {stale_date.isoformat()}")
+                    if stale_date == yesterday:
+                        auto_wrapup_ran = True
+                        journal_content = wrapped_content
+                else:
+                    print(f"  ✗ No checkpoints found for {stale_date.isoformat()}")
+        else:
+            print("No stale checkpoints found.")
+
+        # Step 2: Read yesterday's journal
+        # If auto-wrapup handled yesterday we already have it - no need to re-read
+        if journal_content is None:
+            journal_content = read_journal_entry(yesterday)
+        if journal_content:
+            print(f"Found journal entry for {yesterday.isoformat()} ({len(journal_content):,} chars)")
+        else:
+            print(f"No journal entry found for {yesterday.isoformat()}")
 
-    # Step 3: Fetch news headlines and synthesize
-    print("Fetching news headlines...")
-    try:
-        headlines = fetch_all_headlines()
-        print("Synthesizing news vibe...")
-        news_vibe = synthesize_news_vibe(headlines)
-        print(f"News vibe: {news_vibe[:80]}...")
-    except Exception as e:
-        print(f"Error fetching/synthesizing news: {e}")
-        news_vibe = "📰 *News unavailable today - feeds may be down*"
+        # Step 3: Collect the news vibe (waits for the background thread)
+        news_vibe = news_vibe_future.result()
 
     # Step 4: Build and send email
     subject, body = build_heartbeat_email(yesterday, journal_content, auto_wrapup_ran, news_vibe)
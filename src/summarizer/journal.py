@@ -7,7 +7,9 @@ This module handles all interactions with the work-journal directory:
 - Reading entry contents for summarization
 """
 
+import os  # Low-level OS interface (os.scandir for fast directory listing)
 import re  # Regular expressions for pattern matching in strings
+from concurrent.futures import ThreadPoolExecutor  # Run blocking calls (like file reads) in parallel
 from datetime import date, timedelta  # date = calendar date, timedelta = duration between dates
 from pathlib import Path  # Object-oriented filesystem paths (modern replacement for os.path)
 
@@ -15,6 +17,18 @@ from pathlib import Path  # Object-oriented filesystem paths (modern replacement
 from . import config
 
 
+# Summary filename pattern, compiled once at import rather than on every call.
+# (Daily entry names are fixed-width, so parse_date_from_filename() checks
+# them with plain string slicing instead of a regex.)
+#
+# Summary: 2026-01-08-SUMMARY-14-days.md (or ...-DRAFT.md)
+# The .* near the end matches optional suffixes like "-DRAFT"
+_SUMMARY_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-SUMMARY-14-days.*\.md$")
+
+# Threads used by gather_entries() to read entry files concurrently
+_READ_WORKERS = 8
+
+
 def get_journal_path() -> Path:
     """
     Return the path to the work journal directory.
@@ -54,17 +68,19 @@ def parse_date_from_filename(filename: str) -> date | None:
     - Older code writes this as `Optional[date]` using `from typing import Optional`
     - The `|` union syntax is preferred in modern Python
 
-    Regex breakdown for r"^(\\d{4})-(\\d{2})-(\\d{2})\\.md$":
-    - r"..." is a raw string (backslashes aren't escape sequences)
-    - ^       = start of string
-    - (\\d{4}) = capture group: exactly 4 digits (year)
-    - -        = literal hyphen
-    - (\\d{2}) = capture group: exactly 2 digits (month)
-    - -        = literal hyphen
-    - (\\d{2}) = capture group: exactly 2 digits (day)
-    - \\.      = literal dot (escaped because . means "any char" in regex)
-    - md      = literal "md"
-    - $       = end of string
+    Entry filenames are always exactly 13 characters, so instead of a regex
+    we check the fixed positions directly (this runs once per file in the
+    directory, and slicing is much cheaper than regex matching):
+
+        2026-01-07.md
+        0123456789...
+        ^^^^ ^^ ^^
+        year mo day   with "-" at index 4 and 7, ending in ".md"
+
+    Syntax notes:
+    - filename[:4] is a "slice": characters from index 0 up to (not including) 4
+    - .isascii() and .isdigit() together mean "only the characters 0-9"
+      (.isdigit() alone also accepts things like superscript digits)
 
     Args:
         filename: Just the filename, not the full path (e.g., "2026-01-07.md")
@@ -72,14 +88,67 @@ def parse_date_from_filename(filename: str) -> date | None:
     Returns:
         A date object if the filename matches the pattern, None otherwise.
     """
-    match = re.match(r"^(\d{4})-(\d{2})-(\d{2})\.md$", filename)
-    if match:
-        # match.group(1) returns the first captured group (year)
-        # match.group(2) returns the second captured group (month)
-        # match.group(3) returns the third captured group (day)
-        # int() converts the string "2026" to the integer 2026
-        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-    return None
+    if (
+        len(filename) != 13
+        or filename[4] != "-"
+        or filename[7] != "-"
+        or not filename.endswith(".md")
+    ):
+        return None
+
+    year, month, day = filename[:4], filename[5:7], filename[8:10]
+    digits = year + month + day
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+
+    # int() converts the string "2026" to the integer 2026
+    return date(int(year), int(month), int(day))
+
+
+def read_file_text(path: Path | str) -> str:
+    """
+    Read a whole (small) text file as UTF-8.
+
+    Equivalent to path.read_text(encoding="utf-8") for our journal files,
+    but skips Python's buffered-file layer. A normal open() sets up a
+    buffer, checks whether the file is a terminal, seeks, etc. - all
+    wasted for a one-shot read of a whole file. Here we ask the OS for
+    the file size once and read that many bytes directly.
+
+    Like read_text(), Windows ("\r\n") and old Mac ("\r") line endings
+    come back as "\n", so the rest of the code only ever sees "\n".
+
+    Syntax notes:
+    - os.open/os.read/os.close are thin wrappers over the OS system calls
+      and work with integer "file descriptors" instead of file objects
+    - os.fstat(fd).st_size is the file size in bytes
+    - try/finally guarantees the file is closed even if reading fails
+
+    Args:
+        path: File to read
+
+    Returns:
+        The file contents as a string
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+        # The OS may return fewer bytes than asked (or the file may have
+        # grown since fstat), so keep going until read returns nothing
+        while chunk := os.read(fd, 65536):
+            data += chunk
+    finally:
+        os.close(fd)
+    text = data.decode("utf-8")
+
+    # read_text() translates line endings for us; we have to do it by hand.
+    # Most files have no "\r" at all, so check before doing two replaces.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def find_latest_summary(summaries_path: Path | None = None) -> date | None:
@@ -90,9 +159,11 @@ def find_latest_summary(summaries_path: Path | None = None) -> date | None:
     (or YYYY-MM-DD-SUMMARY-14-days-DRAFT.md for drafts)
 
     Syntax notes:
-    - re.compile() pre-compiles a regex pattern for reuse (minor performance benefit)
-    - summaries_path.iterdir() yields each item in the directory as a Path object
-    - file.name gives just the filename (not the full path)
+    - _SUMMARY_RE is pre-compiled with re.compile() at module level (see top)
+    - os.scandir() yields a DirEntry per item; unlike Path.iterdir() it doesn't
+      build a Path object for every file, and we only need the names here
+    - `with` closes the directory handle when we're done
+    - entry.name gives just the filename (not the full path)
 
     Args:
         summaries_path: Override the default summaries location (useful for testing)
@@ -103,20 +174,19 @@ def find_latest_summary(summaries_path: Path | None = None) -> date | None:
     if summaries_path is None:
         summaries_path = get_summaries_path()
 
-    # The .* near the end matches optional suffixes like "-DRAFT"
-    summary_pattern = re.compile(r"^(\d{4})-(\d{2})-(\d{2})-SUMMARY-14-days.*\.md$")
     latest = None  # Will hold the most recent summary date we find
 
     if not summaries_path.exists():
         return None
 
-    for file in summaries_path.iterdir():
-        match = summary_pattern.match(file.name)
-        if match:
-            summary_date = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-            # Update latest if this is the first summary or more recent than previous
-            if latest is None or summary_date > latest:
-                latest = summary_date
+    with os.scandir(summaries_path) as it:
+        for entry in it:
+            match = _SUMMARY_RE.match(entry.name)
+            if match:
+                summary_date = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+                # Update latest if this is the first summary or more recent than previous
+                if latest is None or summary_date > latest:
+                    latest = summary_date
 
     return latest
 
@@ -144,22 +214,24 @@ def needs_summary(lookback_days: int = 14) -> bool:
     return days_since_summary >= lookback_days
 
 
-def gather_entries(entries_path: Path | None = None, lookback_days: int = 14) -> list[dict]:
+def find_entry_files(entries_path: Path | None = None, lookback_days: int = 14) -> list[tuple[date, Path]]:
     """
-    Gather journal entries from the last N days.
+    Find journal entry files from the last N days, without reading them.
+
+    This is the directory-scan half of gather_entries(). Keeping it separate
+    means the scan is a single pass over the directory listing, and file
+    contents are only read once we know which files we actually want.
 
     Syntax notes:
-    - `list[dict]` is a type hint meaning "a list containing dict objects"
-    - More precise would be `list[dict[str, date | str]]` but that's verbose
+    - `list[tuple[date, Path]]` means "a list of (date, Path) pairs"
     - timedelta(days=14) creates a duration of 14 days
 
     Args:
         entries_path: Override the default entries location (useful for testing)
-        lookback_days: How many days of entries to gather
+        lookback_days: How many days of entries to include
 
     Returns:
-        List of dicts with 'date', 'filename', and 'content' keys,
-        sorted by date ascending (oldest first for chronological reading).
+        List of (entry_date, file_path) pairs, sorted by date ascending.
     """
     if entries_path is None:
         entries_path = get_entries_path()
@@ -167,27 +239,67 @@ def gather_entries(entries_path: Path | None = None, lookback_days: int = 14) ->
     # Calculate the oldest date we'll include
     # date.today() returns today's date; subtracting timedelta shifts it back
     cutoff = date.today() - timedelta(days=lookback_days)
-    entries = []
+    entry_files = []
 
     if not entries_path.exists():
-        return entries
-
-    for file in entries_path.iterdir():
-        entry_date = parse_date_from_filename(file.name)
-
-        # Skip files that don't match the date pattern (like SUMMARY files)
-        # Also skip entries older than our cutoff
-        if entry_date and entry_date >= cutoff:
-            entries.append({
-                "date": entry_date,
-                "filename": file.name,
-                # file.read_text() reads the entire file as a string
-                # Path objects have this method built in (no need for open())
-                "content": file.read_text(),
-            })
-
-    # Sort entries by date, oldest first
-    # key=lambda e: e["date"] tells sort() to compare entries by their "date" value
-    # lambda creates a small anonymous function: takes e, returns e["date"]
-    entries.sort(key=lambda e: e["date"])
-    return entries
+        return entry_files
+
+    # os.scandir() is cheaper than Path.iterdir() - see find_latest_summary()
+    # We only build Path objects for the files we keep
+    with os.scandir(entries_path) as it:
+        for entry in it:
+            entry_date = parse_date_from_filename(entry.name)
+
+            # Skip files that don't match the date pattern (like SUMMARY files)
+            # Also skip entries older than our cutoff
+            if entry_date and entry_date >= cutoff:
+                entry_files.append((entry_date, Path(entry.path)))
+
+    # Sort by date, oldest first
+    # Tuples compare element by element, so this sorts on the date
+    # (dates are unique per file, so the Path is never compared)
+    entry_files.sort()
+    return entry_files
+
+
+def gather_entries(entries_path: Path | None = None, lookback_days: int = 14) -> list[dict]:
+    """
+    Gather journal entries from the last N days.
+
+    Files are read concurrently by a small thread pool. Reading a file is
+    mostly waiting on the disk (or network, if the journal lives on a synced
+    or mounted drive), and Python releases the GIL while it waits, so the
+    reads overlap instead of queueing up one behind another.
+
+    Syntax notes:
+    - `list[dict]` is a type hint meaning "a list containing dict objects"
+    - More precise would be `list[dict[str, date | str]]` but that's verbose
+    - executor.map(func, items) works like map() but runs calls on the pool,
+      still returning results in the same order as items
+
+    Args:
+        entries_path: Override the default entries location (useful for testing)
+        lookback_days: How many days of entries to gather
+
+    Returns:
+        List of dicts with 'date', 'filename', and 'content' keys,
+        sorted by date ascending (oldest first for chronological reading).
+    """
+    # find_entry_files() already returns them sorted oldest first
+    entry_files = find_entry_files(entries_path, lookback_days)
+    if not entry_files:
+        return []
+
+    # read_file_text() reads the entire file as a string (see above)
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+        contents = list(executor.map(read_file_text, [file for _, file in entry_files]))
+
+    return [
+        {
+            "date": entry_date,
+            "filename": file.name,
+            "content": content,
+        }
+        # zip() pairs each (date, file) with its content, in order
+        for (entry_date, file), content in zip(entry_files, contents)
+    ]
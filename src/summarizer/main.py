@@ -11,22 +11,49 @@ This module orchestrates the full flow:
 Run with: uv run python -m summarizer
 """
 
-import argparse  # Standard library for parsing command-line arguments
+# Makes all type hints strings, so `argparse.Namespace` below doesn't need
+# argparse imported at runtime (see TYPE_CHECKING block)
+from __future__ import annotations
+
 import sys  # System-specific parameters and functions (like sys.exit)
+from types import SimpleNamespace  # Plain attribute container (already loaded by Python itself)
+from typing import TYPE_CHECKING
+
+# argparse (the standard library's command-line parser) is only imported when
+# we actually need it - see parse_args()
+if TYPE_CHECKING:
+    import argparse
+
+# Sibling modules are imported inside main(), in the branch that needs them,
+# using relative imports (the dot (.) means "from the current package").
+# Several of them pull in heavy SDKs (Google API client, requests, ...),
+# so importing lazily keeps `--help` and the "no summary needed" path fast.
+
 
-# Import from our sibling modules using relative imports
-# The dot (.) means "from the current package"
-from .email_sender import send_summary_email
-from .heartbeat import run_heartbeat
-from .journal import gather_entries, needs_summary
-from .reply_processor import process_replies
-from .summarize import generate_summary, save_draft
+# Flags that take no value. If the command line is only made of these, we can
+# skip argparse entirely (see parse_args()).
+# Maps the flag to its attribute name on the returned args object.
+_SIMPLE_FLAGS = {
+    "--dry-run": "dry_run",
+    "--force": "force",
+    "--no-email": "no_email",
+    "--check-replies": "check_replies",
+    "--heartbeat": "heartbeat",
+}
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace | SimpleNamespace:
     """
     Parse command-line arguments.
 
+    launchd runs us hourly with `--check-replies` and nightly with
+    `--heartbeat`. For those (and any other command line made only of simple
+    on/off flags) we build the result directly instead of importing and
+    setting up argparse, which costs more than the rest of startup combined
+    for a CLI this small. Anything else - `--help`, `--days N`, or a typo -
+    goes through the full argparse parser, so help text and error messages
+    are unchanged.
+
     Syntax notes:
     - argparse.ArgumentParser creates a parser that handles --help automatically
     - add_argument() defines each flag/option
@@ -34,9 +61,26 @@ def parse_args() -> argparse.Namespace:
     - "--days" creates an option that takes a value
     - parse_args() returns a Namespace object where args.dry_run, args.days, etc. exist
 
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:], like argparse)
+
     Returns:
         Namespace object with parsed arguments as attributes.
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast path: every token is a known simple flag
+    # set(argv) <= set(...) means "every item of argv is one of the flags"
+    if set(argv) <= _SIMPLE_FLAGS.keys():
+        return SimpleNamespace(
+            days=14,  # Same defaults as --days and --model below
+            model=None,
+            **{attr: flag in argv for flag, attr in _SIMPLE_FLAGS.items()},
+        )
+
+    import argparse
+
     # The description shows up when users run with --help
     parser = argparse.ArgumentParser(
         description="Generate bi-weekly summaries of work journal entries."
@@ -58,6 +102,14 @@ def parse_args() -> argparse.Namespace:
         help="Number of days to look back for entries (default: 14).",
     )
 
+    # --model overrides the summary model from config for this run
+    # default=None means "use the config value" (see generate_summary())
+    parser.add_argument(
+        "--model",
+        default=None,
+        help="Claude model for the summary (default: anthropic.summary_model from config).",
+    )
+
     # --force skips the "needs summary" check
     parser.add_argument(
         "--force",
@@ -88,7 +140,7 @@ def parse_args() -> argparse.Namespace:
         help="Run daily heartbeat: auto-wrapup stale checkpoints, send status email (run at 1am via launchd).",
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def main() -> int:
@@ -108,14 +160,20 @@ def main() -> int:
     # Handle --check-replies mode (separate from summary generation)
     # This mode processes email replies and doesn't generate summaries
     if args.check_replies:
+        from .reply_processor import process_replies
+
         print("Running in reply-processing mode...")
         processed = process_replies()
         return 0 if processed >= 0 else 1
 
     # Handle --heartbeat mode (daily heartbeat with auto-wrapup)
     if args.heartbeat:
+        from .heartbeat import run_heartbeat
+
         return run_heartbeat()
 
+    from .journal import gather_entries, needs_summary
+
     # Check if we need to generate a summary
     if not args.force and not needs_summary(args.days):
         print(f"A summary was generated within the last {args.days} days. Skipping.")
@@ -143,36 +201,75 @@ def main() -> int:
         return 0
 
     # Generate the summary via Claude API
+    from .reply_processor import clear_pending_feedback, load_pending_feedback
+    from .summarize import generate_summary, save_draft
+
+    # Revision requests from replies to earlier summaries (see
+    # reply_processor.py) are applied to this one, then cleared
+    feedback = [item["feedback"] for item in load_pending_feedback()]
+    if feedback:
+        print(f"\nApplying {len(feedback)} piece(s) of feedback from earlier replies.")
+
     print("\nGenerating summary via Claude API...")
+
+    # Print a preview of the summary live, as it streams in
+    # (so there's something to look at while Claude is still writing)
+    # The heading is printed with the first piece of text, after any
+    # messages generate_summary() prints while preparing the request
+    preview_left = 500
+    heading_printed = False
+
+    def print_preview(text: str) -> None:
+        # `nonlocal` lets this inner function update main()'s variables
+        nonlocal preview_left, heading_printed
+        if not heading_printed:
+            print("\n" + "=" * 60)
+            print("SUMMARY PREVIEW (first 500 chars):")
+            print("=" * 60)
+            heading_printed = True
+        if preview_left > 0:
+            # end="" stops print() adding a newline; flush=True shows the
+            # text right away instead of waiting for a full line
+            print(text[:preview_left], end="", flush=True)
+            preview_left -= len(text)
+
     try:
-        summary = generate_summary(entries)
-    except FileNotFoundError:
-        print("Error: API key not found at ~/.secrets/shared/anthropic-api-key.txt")
+        # If the prompt was over budget, the oldest entries were left out;
+        # from here on `entries` is what the summary actually covers
+        summary, entries = generate_summary(
+            entries, model=args.model, on_text=print_preview, feedback=feedback
+        )
+    except FileNotFoundError as e:
+        # The message includes the configured key path (see get_anthropic_key())
+        print(f"\nError: {e}")
         print("Please create this file with your Anthropic API key.")
-        print("See ~/.secrets/README.md for the secrets organization pattern.")
         return 1
     except Exception as e:
         # Catch-all for API errors
         # In production code, you'd catch specific exception types
-        print(f"Error calling Claude API: {e}")
+        print(f"\nError calling Claude API: {e}")
         return 1
 
+    print()  # End the preview's last line
+    if len(summary) > 500:
+        print(f"\n... ({len(summary) - 500} more characters)")
+
     # Save the draft to periodic-summaries/
+    # Only once the whole summary has arrived: a half-written draft would
+    # count as "a recent summary" and suppress the next run
     draft_path = save_draft(summary, entries)
     print(f"\nDraft saved to: {draft_path}")
 
-    # Print a preview of the summary
-    print("\n" + "=" * 60)
-    print("SUMMARY PREVIEW (first 500 chars):")
-    print("=" * 60)
-    print(summary[:500])
-    if len(summary) > 500:
-        print(f"\n... ({len(summary) - 500} more characters)")
+    # The feedback is in this draft now; don't apply it again next time
+    if feedback:
+        clear_pending_feedback(len(feedback))
 
     # Send email notification (unless --no-email flag is set)
     if args.no_email:
         print("\n[--no-email] Skipping email notification.")
     else:
+        from .email_sender import send_summary_email
+
         # Build date range string from the entries
         # entries[0] is oldest (first), entries[-1] is newest (last)
         # .isoformat() converts date object to "YYYY-MM-DD" string
@@ -19,33 +19,65 @@ Why Claude Haiku?
 - Compared to Sonnet/Opus, this saves 10-20x on a task that doesn't need deep reasoning
 """
 
+import binascii
+import hashlib
 import json
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor  # Run blocking calls (like API requests) in parallel
 from datetime import datetime
+from fnmatch import fnmatch  # Shell-style filename matching ("*.md")
 from pathlib import Path
 
-import anthropic  # For calling Claude Haiku
-
 # Import our config system
 from . import config
 
 # Import Gmail utilities from our email_sender module
 from .email_sender import (
-    get_gmail_credentials,
+    get_gmail_service,
     send_email,
+    send_emails_batch,
     get_secrets_path,
 )
-from .summarize import get_anthropic_key
+from .summarize import get_anthropic_client
 
-# Google API for reading emails
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# Google API for reading emails is imported inside the functions that use it
+# (same reason as in email_sender.py - it's slow to import)
 
 
 # ---------------------------------------------------------------------------
 # Gmail Reading
 # ---------------------------------------------------------------------------
 
+# Maximum number of requests Gmail accepts in a single batch
+_GMAIL_BATCH_LIMIT = 100
+
+# How deeply nested a text/plain part can be and still be found. Real mail
+# rarely goes past 3 (e.g. multipart/mixed > multipart/alternative >
+# text/plain); the limit only exists because the fields filter below has to
+# spell out each level.
+_MAX_PART_DEPTH = 5
+
+# Parts of each message we actually use, as a Gmail API "fields" filter.
+# Without it, format="full" also returns labelIds, snippet, sizeEstimate,
+# historyId, internalDate, and per-part headers/filenames/attachment info,
+# which we'd download and JSON-decode only to ignore.
+#
+# Matches what _get_header() and _get_body() read:
+# - payload.headers: Subject / From
+# - payload.body.data: simple (non-multipart) body
+# - payload.parts[], nested up to _MAX_PART_DEPTH levels: mimeType + body.data
+#
+# The parts filter is built inside-out, giving
+#   parts(mimeType,body/data,parts(mimeType,body/data,parts(...)))
+_PARTS_FIELDS = "parts(mimeType,body/data)"
+for _ in range(_MAX_PART_DEPTH - 1):
+    _PARTS_FIELDS = f"parts(mimeType,body/data,{_PARTS_FIELDS})"
+
+_MESSAGE_FIELDS = f"threadId,payload(headers(name,value),body/data,{_PARTS_FIELDS})"
+
+
 def get_unread_replies() -> list[dict]:
     """
     Fetch unread emails that are replies to our summary emails.
@@ -53,6 +85,9 @@ def get_unread_replies() -> list[dict]:
     Gmail search query breakdown:
     - `in:inbox`: Only look in inbox (not spam, trash, etc.)
     - `is:unread`: Only unread messages
+    - `newer_than:14d`: Only recent mail (one summary cycle; from
+      journal.lookback_days), so Gmail searches a bounded slice of the
+      mailbox instead of all of it
     - `subject:"[Work Journal]"`: Must have our subject prefix
 
     Returns:
@@ -63,27 +98,29 @@ def get_unread_replies() -> list[dict]:
         - 'body': Plain text body content
         - 'from': Sender email address
     """
-    creds = get_gmail_credentials()
-    if not creds:
+    from googleapiclient.errors import HttpError
+
+    # Shared with send_email(), so confirmations reuse this client
+    service = get_gmail_service()
+    if not service:
         print("Failed to get Gmail credentials. Cannot check replies.")
         return []
 
     try:
-        # Build the Gmail API client
-        service = build("gmail", "v1", credentials=creds)
-
         # Search for unread replies to our summary emails
         # The query syntax is Gmail's search syntax (same as the Gmail web UI)
         # Subject prefix comes from config
         subject_prefix = config.get("email.subject_prefix")
-        query = f'in:inbox is:unread subject:"{subject_prefix}"'
+        max_age_days = config.get("journal.lookback_days")
+        query = f'in:inbox is:unread newer_than:{max_age_days}d subject:"{subject_prefix}"'
 
         # users().messages().list() returns message IDs matching the query
         # We need to fetch full message content separately
         results = service.users().messages().list(
             userId="me",
             q=query,
-            maxResults=10  # Limit to 10 most recent
+            maxResults=10,  # Limit to 10 most recent
+            fields="messages/id",  # We only need the IDs
         ).execute()
 
         # Get the list of message IDs (may be empty)
@@ -93,26 +130,41 @@ def get_unread_replies() -> list[dict]:
         if not messages:
             return []
 
-        # Fetch full content for each message
-        replies = []
-        for msg in messages:
-            # users().messages().get() fetches the full message
-            # format="full" includes headers and body
-            full_msg = service.users().messages().get(
-                userId="me",
-                id=msg["id"],
-                format="full"
-            ).execute()
+        # Fetch full content for all messages in one batch request
+        # (one HTTP round-trip instead of one per message)
+        # The callback runs once per message, possibly out of order,
+        # so we collect by ID and restore the original order afterwards
+        fetched = {}
 
+        def on_message(request_id: str, full_msg: dict, exception: Exception | None) -> None:
+            if exception is not None:
+                print(f"Gmail API error fetching message {request_id}: {exception}")
+                return
             # Extract the data we need
-            reply = {
-                "id": msg["id"],
+            fetched[request_id] = {
+                "id": request_id,
                 "thread_id": full_msg.get("threadId"),
                 "subject": _get_header(full_msg, "Subject"),
                 "from": _get_header(full_msg, "From"),
                 "body": _get_body(full_msg),
             }
-            replies.append(reply)
+
+        # Gmail allows at most 100 requests per batch
+        for start in range(0, len(messages), _GMAIL_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=on_message)
+            for msg in messages[start:start + _GMAIL_BATCH_LIMIT]:
+                # users().messages().get() fetches the full message
+                # format="full" includes headers and body; fields= trims the
+                # response to just what we read (see _MESSAGE_FIELDS)
+                batch.add(
+                    service.users().messages().get(
+                        userId="me", id=msg["id"], format="full", fields=_MESSAGE_FIELDS
+                    ),
+                    request_id=msg["id"],
+                )
+            batch.execute()
+
+        replies = [fetched[msg["id"]] for msg in messages if msg["id"] in fetched]
 
         return replies
 
@@ -148,19 +200,48 @@ def _get_header(message: dict, header_name: str) -> str:
     )
 
 
+# base64url uses "-" and "_" where standard base64 uses "+" and "/"
+# bytes.maketrans() builds a lookup table for bytes.translate()
+_B64URL_TO_STD = bytes.maketrans(b"-_", b"+/")
+
+
+def _b64url_decode(data: str) -> bytes:
+    """
+    Decode base64url text (as used by the Gmail API) to bytes.
+
+    Same result as base64.urlsafe_b64decode(), but goes straight to the
+    C-level binascii decoder: one translate pass to standard base64, then
+    decode. Also tolerates missing "=" padding, which
+    urlsafe_b64decode() rejects.
+
+    Syntax notes:
+    - -len(raw) % 4 is how many characters short of a multiple of 4 we are
+      (base64 text always comes in groups of 4)
+    """
+    raw = data.encode("ascii")
+    padding = b"=" * (-len(raw) % 4)
+    return binascii.a2b_base64(raw.translate(_B64URL_TO_STD) + padding)
+
+
 def _get_body(message: dict) -> str:
     """
     Extract plain text body from a Gmail message.
 
     Email structure can be complex:
     - Simple emails: body is directly in payload.body.data
-    - Multipart emails: body is in one of payload.parts[]
+    - Multipart emails: body is in one of payload.parts[], and parts can
+      themselves have parts (e.g. an attachment alongside a
+      text + HTML "alternative" pair)
 
-    We look for text/plain content type and decode it.
+    We look for the first text/plain part, in document order, and decode it.
 
     Syntax notes:
     - Email bodies are base64url-encoded (for safe transmission)
-    - We decode to get the actual text
+    - We decode to get the actual text; errors="replace" turns any invalid
+      UTF-8 into a placeholder character instead of raising
+    - Instead of recursion, we walk the tree with an explicit "stack" list:
+      pop a part, check it, push its children. reversed() makes the first
+      child come off the stack first, keeping document order.
 
     Args:
         message: Gmail message dict (from API)
@@ -168,74 +249,260 @@ def _get_body(message: dict) -> str:
     Returns:
         Plain text body content
     """
-    import base64
-
     payload = message.get("payload", {})
 
     # Try to get body directly (simple non-multipart messages)
     body_data = payload.get("body", {}).get("data")
     if body_data:
-        return base64.urlsafe_b64decode(body_data).decode("utf-8")
+        return _b64url_decode(body_data).decode("utf-8", "replace")
+
+    # For multipart messages, search the parts depth-first
+    stack = list(reversed(payload.get("parts", [])))
+    while stack:
+        part = stack.pop()
 
-    # For multipart messages, look through parts
-    parts = payload.get("parts", [])
-    for part in parts:
         # Look for text/plain content
         if part.get("mimeType") == "text/plain":
             part_data = part.get("body", {}).get("data")
             if part_data:
-                return base64.urlsafe_b64decode(part_data).decode("utf-8")
+                return _b64url_decode(part_data).decode("utf-8", "replace")
 
-        # Recursively check nested parts (for complex emails)
-        nested_parts = part.get("parts", [])
-        for nested in nested_parts:
-            if nested.get("mimeType") == "text/plain":
-                nested_data = nested.get("body", {}).get("data")
-                if nested_data:
-                    return base64.urlsafe_b64decode(nested_data).decode("utf-8")
+        # Check nested parts (for complex emails) before this part's siblings
+        stack.extend(reversed(part.get("parts", [])))
 
     return ""  # No plain text body found
 
 
-def mark_as_read(message_id: str) -> bool:
+def mark_as_read_batch(message_ids: list[str]) -> bool:
     """
-    Mark a Gmail message as read by removing the UNREAD label.
+    Mark several Gmail messages as read in one API call.
 
     Gmail uses labels for status. UNREAD is a special system label.
     Removing it marks the message as read.
 
+    batchModify() applies the same label change to up to 1000 messages at
+    once, so marking all of a run's replies as read is a single HTTP
+    round-trip instead of one per message.
+
     Args:
-        message_id: Gmail message ID
+        message_ids: Gmail message IDs
 
     Returns:
-        True if successful, False otherwise
+        True if successful (or nothing to do), False otherwise
     """
-    creds = get_gmail_credentials()
-    if not creds:
+    from googleapiclient.errors import HttpError
+
+    if not message_ids:
+        return True
+
+    service = get_gmail_service()
+    if not service:
         return False
 
     try:
-        service = build("gmail", "v1", credentials=creds)
-
         # Modify labels: remove UNREAD
-        service.users().messages().modify(
+        service.users().messages().batchModify(
             userId="me",
-            id=message_id,
-            body={"removeLabelIds": ["UNREAD"]}
+            body={"ids": message_ids, "removeLabelIds": ["UNREAD"]}
         ).execute()
 
         return True
 
     except HttpError as error:
-        print(f"Failed to mark message as read: {error}")
+        print(f"Failed to mark messages as read: {error}")
         return False
 
 
+def mark_as_read(message_id: str) -> bool:
+    """
+    Mark a single Gmail message as read.
+
+    Thin wrapper around mark_as_read_batch(), kept for callers that only
+    have one message.
+
+    Args:
+        message_id: Gmail message ID
+
+    Returns:
+        True if successful, False otherwise
+    """
+    return mark_as_read_batch([message_id])
+
+
 # ---------------------------------------------------------------------------
 # Intent Classification
 # ---------------------------------------------------------------------------
 
-def classify_reply(reply_body: str) -> tuple[str, str]:
+# Threads used by process_replies() to classify replies concurrently.
+# get_unread_replies() fetches at most 10, so this covers a full batch.
+_CLASSIFY_WORKERS = 10
+
+# Replies that are unambiguously an approval on their own, like "LGTM",
+# "looks good!", or "👍". Matched against the whole normalized reply (see
+# _normalize_reply()), so "looks good but change X" does NOT match and still
+# goes to Haiku, which is what extracts the feedback.
+#
+# Syntax notes:
+# - ^ and $ anchor the match to the start and end of the text
+# - (?:...) is a non-capturing group; `a|b` matches either alternative
+# - [\s.!]* allows trailing spaces and punctuation ("ok!!", "thanks.")
+_APPROVE_RE = re.compile(
+    r"^(?:lgtm|looks good|approved?|ship it|yes|ok(?:ay)?|thanks|thank you|great|👍|✅)"
+    r"[\s.!]*$"
+)
+
+# Gmail's "On <date>, <name> wrote:" line that introduces the quoted original
+_QUOTE_INTRO_RE = re.compile(r"^on .+ wrote:$", re.I)
+
+# Lines of Haiku's response (see the format in classify_reply()'s prompt)
+#
+# Syntax notes:
+# - re.M ("multiline") makes ^ and $ match at the start/end of every line,
+#   not just of the whole string
+# - [ \t]* matches spaces/tabs only, so an empty "FEEDBACK:" line can't
+#   spill over and capture the line after it (\s* would match the newline)
+# - (.*?) is "lazy": it stops as soon as the rest of the pattern can match,
+#   leaving trailing spaces to [ \t]*$
+_CLASSIFICATION_LINE_RE = re.compile(
+    r"^CLASSIFICATION:[ \t]*(APPROVE|REVISE|UNCLEAR)\b", re.M
+)
+_FEEDBACK_LINE_RE = re.compile(r"^FEEDBACK:[ \t]*(.*?)[ \t]*$", re.M)
+
+
+def _strip_quoted(reply_body: str) -> str:
+    """
+    Reduce a reply to just what the user typed.
+
+    Drops the quoted original email (lines starting with ">" and the
+    "On ... wrote:" line above them) and collapses all runs of whitespace
+    to single spaces. Case and length are left alone.
+
+    Syntax notes:
+    - str.split() with no argument splits on any whitespace and drops empties,
+      so " ".join(text.split()) collapses whitespace
+
+    Args:
+        reply_body: The text of the user's email reply
+
+    Returns:
+        The reply text without the quoted original
+    """
+    lines = [
+        line
+        for line in reply_body.splitlines()
+        if not line.lstrip().startswith(">")
+        and not _QUOTE_INTRO_RE.match(line.strip())
+    ]
+    return " ".join(" ".join(lines).split())
+
+
+def _normalize_reply(reply_body: str) -> str:
+    """
+    Reduce a reply to a short canonical form for matching _APPROVE_RE.
+
+    Same as _strip_quoted(), then lowercased and cut to the first 200
+    characters - a bare approval is only ever a few words long.
+
+    Syntax notes:
+    - text[:200] is at most the first 200 characters (shorter text is fine)
+
+    Args:
+        reply_body: The text of the user's email reply
+
+    Returns:
+        The normalized reply text
+    """
+    return _strip_quoted(reply_body).lower()[:200]
+
+
+# ---------------------------------------------------------------------------
+# Classification Cache
+# ---------------------------------------------------------------------------
+
+# Haiku's answers, keyed by a hash of the model and reply text. People tend
+# to send the same few replies every time ("looks good, thanks!"), so most
+# replies that get past _APPROVE_RE have been classified before.
+#
+# Cache format: {key: [classification, feedback]}, oldest first.
+# Only the hash of the reply is stored, not the reply itself.
+
+# Keep at most this many entries (oldest are dropped first)
+_CLASSIFY_CACHE_MAX = 512
+
+# Loaded on first use by _get_classify_cache()
+_classify_cache: dict[str, list[str]] | None = None
+
+# classify_reply() runs on several threads at once (see process_replies()),
+# so reads and writes of the cache go through this lock
+_classify_cache_lock = threading.Lock()
+
+
+def get_classify_cache_path() -> Path:
+    """Path to the reply classification cache (classify-cache.json)."""
+    return get_secrets_path() / "classify-cache.json"
+
+
+def _classify_cache_key(reply_body: str, model: str) -> str:
+    """
+    Cache key for a reply: a short hash of the model and the reply text.
+
+    The model is part of the key, so switching anthropic.classify_model
+    asks the new model rather than reusing the old one's answers.
+
+    The whole reply is hashed (minus the quoted original and extra
+    whitespace), not the 200-character prefix _normalize_reply() gives:
+    two long replies that only differ near the end are different
+    feedback and must not share a cached answer.
+
+    Syntax notes:
+    - blake2b is a fast hash from the standard library; digest_size=16
+      gives a 32-character hex string, plenty to avoid collisions here
+    - .encode() turns the string into bytes, which is what hashes work on
+    - "\x00" separates the two parts, so ("ab", "c") and ("a", "bc")
+      can't hash the same
+    """
+    text = _strip_quoted(reply_body)
+    return hashlib.blake2b(f"{model}\x00{text}".encode(), digest_size=16).hexdigest()
+
+
+def _get_classify_cache() -> dict[str, list[str]]:
+    """Load the classification cache on first use (empty if missing or unreadable)."""
+    global _classify_cache
+    if _classify_cache is None:
+        try:
+            _classify_cache = json.loads(get_classify_cache_path().read_text())
+        except (OSError, ValueError):
+            _classify_cache = {}
+    return _classify_cache
+
+
+def _store_classification(key: str, classification: str, feedback: str) -> None:
+    """
+    Add a classification to the cache and save it.
+
+    We write to a temp file and then os.replace() it into place, so an
+    interrupted write never leaves a half-written cache behind. Failure to
+    save just means Haiku gets asked again next time.
+
+    Syntax notes:
+    - Dicts remember insertion order, so next(iter(cache)) is the oldest key
+    """
+    with _classify_cache_lock:
+        cache = _get_classify_cache()
+        cache[key] = [classification, feedback]
+        while len(cache) > _CLASSIFY_CACHE_MAX:
+            del cache[next(iter(cache))]
+
+        cache_path = get_classify_cache_path()
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(cache))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"  Warning: Failed to save classification cache: {e}")
+
+
+def classify_reply(reply_body: str, model: str | None = None) -> tuple[str, str]:
     """
     Use Claude Haiku to classify the user's reply intent.
 
@@ -250,14 +517,32 @@ def classify_reply(reply_body: str) -> tuple[str, str]:
 
     Args:
         reply_body: The text of the user's email reply
+        model: The Claude model to use. Defaults to config value.
 
     Returns:
         Tuple of (classification, feedback):
         - classification: "APPROVE", "REVISE", or "UNCLEAR"
         - feedback: Extracted feedback text (empty for APPROVE/UNCLEAR)
     """
-    # Create the API client with our key
-    client = anthropic.Anthropic(api_key=get_anthropic_key())
+    # Bare approvals ("looks good", "👍") don't need a model to classify,
+    # and they're the most common reply. Anything else - including
+    # approvals with extra comments - goes to Haiku.
+    if _APPROVE_RE.match(_normalize_reply(reply_body)):
+        return "APPROVE", ""
+
+    if model is None:
+        model = config.get("anthropic.classify_model")
+
+    # Seen this exact reply before? Reuse Haiku's earlier answer.
+    cache_key = _classify_cache_key(reply_body, model)
+    with _classify_cache_lock:
+        cached = _get_classify_cache().get(cache_key)
+    if cached:
+        classification, feedback = cached
+        return classification, feedback
+
+    # Get the (shared) API client, authenticated with our key
+    client = get_anthropic_client()
 
     # The classification prompt
     # We're very explicit about output format to make parsing easy
@@ -296,9 +581,9 @@ FEEDBACK:
 
 Now classify the reply above."""
 
-    # Call Haiku (model from config - fast + cheap for classification)
+    # Call Haiku (model from config unless given - fast + cheap for classification)
     message = client.messages.create(
-        model=config.get("anthropic.classify_model"),
+        model=model,
         max_tokens=100,  # Short response expected
         messages=[{"role": "user", "content": prompt}]
     )
@@ -306,15 +591,18 @@ Now classify the reply above."""
     # Parse the response
     response_text = message.content[0].text
 
-    # Extract classification using regex
-    # re.search() finds a pattern anywhere in the string
-    # (?:...) is a non-capturing group
-    class_match = re.search(r"CLASSIFICATION:\s*(APPROVE|REVISE|UNCLEAR)", response_text)
+    # Extract classification and feedback using the regexes above
+    # .search() finds the pattern anywhere in the string
+    class_match = _CLASSIFICATION_LINE_RE.search(response_text)
     classification = class_match.group(1) if class_match else "UNCLEAR"
 
-    # Extract feedback
-    feedback_match = re.search(r"FEEDBACK:\s*(.+)", response_text)
-    feedback = feedback_match.group(1).strip() if feedback_match else ""
+    feedback_match = _FEEDBACK_LINE_RE.search(response_text)
+    feedback = feedback_match.group(1) if feedback_match else ""
+
+    # Only cache answers Haiku actually gave. The UNCLEAR fallback for an
+    # unparseable response would otherwise stick to this reply for good.
+    if class_match:
+        _store_classification(cache_key, classification, feedback)
 
     return classification, feedback
 
@@ -331,41 +619,124 @@ def get_pending_feedback_path() -> Path:
     The next summary generation can read this to adjust its prompt.
 
     Returns:
-        Path to pending-feedback.json
+        Path to pending-feedback.jsonl
+    """
+    return get_secrets_path() / "pending-feedback.jsonl"
+
+
+def _import_legacy_feedback(feedback_path: Path) -> None:
     """
-    return get_secrets_path() / "pending-feedback.json"
+    Carry over feedback saved by older versions, once.
+
+    Before pending-feedback.jsonl, feedback was kept as a single JSON list
+    in pending-feedback.json. If that file exists and the .jsonl doesn't
+    yet, its items are written out as the .jsonl's first lines, and the
+    old file is renamed to pending-feedback.json.imported - otherwise it
+    would be imported again once the .jsonl is cleared after a summary.
+
+    Syntax notes:
+    - Path.with_suffix(".json") swaps the last extension: .jsonl -> .json
+    """
+    legacy_path = feedback_path.with_suffix(".json")
+    if feedback_path.exists() or not legacy_path.exists():
+        return
+
+    try:
+        items = json.loads(legacy_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not import {legacy_path.name}: {e}")
+        return
+
+    lines = "".join(json.dumps(item) + "\n" for item in items)
+    feedback_path.write_text(lines, encoding="utf-8")
+    legacy_path.rename(legacy_path.with_name(legacy_path.name + ".imported"))
+    print(f"Imported {len(items)} feedback item(s) from {legacy_path.name}")
 
 
 def save_feedback(feedback: str) -> None:
     """
     Save user feedback to be incorporated into the next summary.
 
-    The feedback file is JSON with a list of feedback items,
-    each timestamped. This allows accumulating multiple pieces
-    of feedback if the user replies multiple times.
+    The feedback file is JSONL ("JSON Lines"): one timestamped JSON object
+    per line. This allows accumulating multiple pieces of feedback if the
+    user replies multiple times, and adding one is just appending a line -
+    no need to read and rewrite everything saved so far.
+
+    Syntax notes:
+    - open("a") opens for appending: writes go to the end of the file,
+      and the file is created if it doesn't exist
 
     Args:
         feedback: The feedback text to save
     """
     feedback_path = get_pending_feedback_path()
+    _import_legacy_feedback(feedback_path)
 
-    # Load existing feedback (if any)
-    if feedback_path.exists():
-        existing = json.loads(feedback_path.read_text())
-    else:
-        existing = []
-
-    # Add new feedback with timestamp
-    existing.append({
+    # Append new feedback with timestamp
+    line = json.dumps({
         "feedback": feedback,
         "timestamp": datetime.now().isoformat(),
     })
+    with feedback_path.open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
 
-    # Save back to file
-    feedback_path.write_text(json.dumps(existing, indent=2))
     print(f"Feedback saved to: {feedback_path}")
 
 
+def load_pending_feedback() -> list[dict]:
+    """
+    Read all pending feedback saved by save_feedback().
+
+    Returns:
+        List of {"feedback": ..., "timestamp": ...} dicts, oldest first
+        (empty if there's no pending feedback).
+    """
+    feedback_path = get_pending_feedback_path()
+    _import_legacy_feedback(feedback_path)
+    if not feedback_path.exists():
+        return []
+
+    # One JSON object per line; skip blank lines
+    return [
+        json.loads(line)
+        for line in feedback_path.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+
+
+def clear_pending_feedback(count: int) -> None:
+    """
+    Remove feedback that has been applied to a summary.
+
+    Only the first `count` items go - the ones main() read before
+    generating the summary. Anything a reply added in the meantime stays
+    for the next summary.
+
+    Args:
+        count: Number of items (oldest first) to remove
+    """
+    feedback_path = get_pending_feedback_path()
+    try:
+        lines = [
+            line
+            for line in feedback_path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+    except FileNotFoundError:
+        return
+
+    remaining = lines[count:]
+    if not remaining:
+        feedback_path.unlink()
+        return
+
+    # Write to a temp file and os.replace() it into place, so an interrupted
+    # write can't lose the feedback that's left
+    tmp_path = feedback_path.with_name(feedback_path.name + ".tmp")
+    tmp_path.write_text("".join(line + "\n" for line in remaining), encoding="utf-8")
+    os.replace(tmp_path, feedback_path)
+
+
 def finalize_draft(date_str: str | None = None) -> bool:
     """
     Rename the most recent draft to finalized (remove -DRAFT suffix).
@@ -384,20 +755,30 @@ def finalize_draft(date_str: str | None = None) -> bool:
 
     summaries_path = get_summaries_path()
 
-    # Find draft files in the periodic-summaries/ subfolder
-    # glob() returns an iterator of Path objects matching the pattern
-    drafts = list(summaries_path.glob("*-SUMMARY-*-DRAFT.md"))
-
-    if not drafts:
+    # Find the most recently modified draft in the periodic-summaries/
+    # subfolder, in a single pass over the directory
+    #
+    # Syntax notes:
+    # - os.scandir() yields DirEntry objects; entry.stat() is cached on the
+    #   entry, so each file is stat()ed at most once
+    # - fnmatch() checks a name against a shell-style pattern like glob() does
+    # - max(..., key=..., default=None) returns the item with the largest
+    #   key, or None if there are no items at all
+    try:
+        with os.scandir(summaries_path) as it:
+            latest = max(
+                (e for e in it if fnmatch(e.name, "*-SUMMARY-*-DRAFT.md")),
+                key=lambda e: e.stat().st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
+        latest = None
+
+    if latest is None:
         print("No draft files found to finalize.")
         return False
 
-    # Sort by modification time (most recent first)
-    # key=lambda p: p.stat().st_mtime gets the modification timestamp
-    drafts.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-
-    # Get the most recent draft
-    draft_path = drafts[0]
+    draft_path = Path(latest.path)
 
     # New name: remove -DRAFT
     # .stem gives filename without extension
@@ -412,16 +793,17 @@ def finalize_draft(date_str: str | None = None) -> bool:
     return True
 
 
-def send_confirmation_email(classification: str, feedback: str = "") -> bool:
+def build_confirmation_email(classification: str, feedback: str = "") -> tuple[str, str]:
     """
-    Send a confirmation email based on the classification.
+    Build the subject and body of a confirmation email for a classification.
 
     Args:
-        classification: "APPROVE", "REVISE", or "UNCLEAR"
+        classification: "APPROVE", "REVISE", or "UNCLEAR" - or "NO_DRAFT"
+                        for an approval with no draft to finalize
         feedback: Extracted feedback (for REVISE case)
 
     Returns:
-        True if email sent successfully
+        Tuple of (subject, body)
     """
     if classification == "APPROVE":
         subject = "[Work Journal] Summary Approved"
@@ -440,6 +822,15 @@ Your feedback: "{feedback}"
 
 The next summary will incorporate this feedback. The current draft remains unchanged.
 
+- work-journal-summarizer bot
+"""
+
+    elif classification == "NO_DRAFT":
+        subject = "[Work Journal] No Draft to Approve"
+        body = """Thanks! I couldn't find a draft summary to approve, so nothing was changed.
+
+It may have been approved already. The next summary will arrive as usual.
+
 - work-journal-summarizer bot
 """
 
@@ -454,6 +845,22 @@ Please respond with one of:
 - work-journal-summarizer bot
 """
 
+    return subject, body
+
+
+def send_confirmation_email(classification: str, feedback: str = "") -> bool:
+    """
+    Send a confirmation email based on the classification.
+
+    Args:
+        classification: "APPROVE", "REVISE", or "UNCLEAR"
+        feedback: Extracted feedback (for REVISE case)
+
+    Returns:
+        True if email sent successfully
+    """
+    subject, body = build_confirmation_email(classification, feedback)
+
     # Use config for email addresses - no hardcoded values
     return send_email(
         to=config.get("email.to"),
@@ -475,7 +882,8 @@ def process_replies() -> int:
     Called via: uv run python -m summarizer --check-replies
 
     Returns:
-        Number of replies processed
+        Number of replies processed, or -1 if something failed (a reply's
+        action, marking replies as read, or sending a confirmation email)
     """
     print("Checking for replies to summary emails...")
 
@@ -487,34 +895,77 @@ def process_replies() -> int:
 
     print(f"Found {len(replies)} unread reply(s).")
 
+    # Classify all replies up front, concurrently
+    # Each classification is a Haiku round-trip that's almost all network
+    # wait, so running them on a thread pool makes the total time roughly
+    # that of the slowest one instead of the sum. The threads share one
+    # Anthropic client (and its connection pool) via get_anthropic_client(),
+    # which is only created if some reply actually needs Haiku - bare
+    # approvals and cached replies don't.
+    # executor.map() returns results in the same order as replies, so the
+    # actions below still happen in inbox order.
+    model = config.get("anthropic.classify_model")  # Looked up once for all replies
+    with ThreadPoolExecutor(max_workers=min(len(replies), _CLASSIFY_WORKERS)) as executor:
+        classifications = list(executor.map(
+            lambda body: classify_reply(body, model), [r["body"] for r in replies]
+        ))
+
+    # Use config for email addresses - no hardcoded values
+    to_addr = config.get("email.to")
+    from_addr = config.get("email.from")
+
     processed = 0
-    for reply in replies:
+    errors = 0
+    handled_ids = []    # Replies whose action went through - marked as read after the loop
+    confirmations = []  # (to, subject, body, from) - sent together after the loop
+    for reply, (classification, feedback) in zip(replies, classifications):
         print(f"\nProcessing reply from: {reply['from']}")
         print(f"  Subject: {reply['subject']}")
 
-        # Classify the reply
-        classification, feedback = classify_reply(reply["body"])
+        # Report the classification
         print(f"  Classification: {classification}")
         if feedback:
             print(f"  Feedback: {feedback}")
 
         # Take action based on classification
-        if classification == "APPROVE":
-            finalize_draft()
-        elif classification == "REVISE":
-            save_feedback(feedback)
-        # UNCLEAR: just send clarification request, no other action
-
-        # Send confirmation email
-        send_confirmation_email(classification, feedback)
+        # A reply is only marked as read once its action has gone through;
+        # if it fails, the reply stays unread and the next run tries again.
+        try:
+            if classification == "APPROVE":
+                if not finalize_draft():
+                    # Nothing was approved - say so, rather than "approved"
+                    classification = "NO_DRAFT"
+            elif classification == "REVISE":
+                save_feedback(feedback)
+            # UNCLEAR: just send clarification request, no other action
+        except OSError as e:
+            print(f"  Error: Could not act on this reply ({e}); leaving it unread.")
+            errors += 1
+            continue
+
+        # Queue the confirmation email
+        subject, body = build_confirmation_email(classification, feedback)
+        confirmations.append((to_addr, subject, body, from_addr))
+
+        handled_ids.append(reply["id"])
+        processed += 1
 
-        # Mark the original reply as read
-        mark_as_read(reply["id"])
+    # Mark the handled replies as read, then send all confirmations in one
+    # Gmail batch request
+    # (The file actions above are local and fast; it's the network calls
+    # that were worth combining.)
+    if not mark_as_read_batch(handled_ids):
+        print("Error: Could not mark the processed replies as read.")
+        errors += 1
 
-        processed += 1
+    # send_emails_batch() returns one True/False per email
+    sent = send_emails_batch(confirmations)
+    if not all(sent):
+        print(f"Error: {sent.count(False)} of {len(sent)} confirmation email(s) failed to send.")
+        errors += 1
 
     print(f"\nProcessed {processed} reply(s).")
-    return processed
+    return -1 if errors else processed
 
 
 # ---------------------------------------------------------------------------
@@ -8,22 +8,44 @@ This module handles:
 - Formatting the response
 """
 
+# Makes all type hints strings, so `anthropic.Anthropic` below doesn't need
+# the SDK imported at runtime (see TYPE_CHECKING block)
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor  # Run blocking calls (like API requests) in parallel
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # The anthropic package is the official Python SDK for Claude
 # Installed via: uv add anthropic
-import anthropic
+#
+# It's slow to import (hundreds of ms of pydantic models), so it's only
+# imported in get_anthropic_client() - the single place every module gets
+# its client from. `--help`, `--dry-run`, and "no summary needed" runs
+# never pay for it.
+if TYPE_CHECKING:
+    import anthropic
 
 # Import our config system for paths and model settings
-from . import config
+from . import cache, config
+from .compress import compress, dedupe_paragraphs
 
 
+@functools.lru_cache(maxsize=1)
 def get_anthropic_key() -> str:
     """
     Read the Anthropic API key from the secrets file.
 
+    The key doesn't change during a run, so it's read once and remembered.
+
     Syntax notes:
+    - @functools.lru_cache remembers the return value; later calls return
+      it without running the function body again
     - config.get_shared_secrets_path() returns the path from configuration
     - This makes the path configurable rather than hardcoded
     - .read_text() reads the entire file as a string
@@ -46,54 +68,73 @@ def get_anthropic_key() -> str:
     # The API key lives in shared/ because multiple projects may use it
     # Path comes from config so it's not hardcoded
     key_path = config.get_shared_secrets_path() / "anthropic-api-key.txt"
-    return key_path.read_text().strip()
+    try:
+        return key_path.read_text().strip()
+    except FileNotFoundError:
+        # Re-raise with a message that says what to do about it
+        # (`from None` hides the original, less helpful traceback)
+        raise FileNotFoundError(
+            f"Anthropic API key not found at {key_path}. "
+            "See ~/.secrets/README.md for the secrets organization pattern."
+        ) from None
+
+
+# The Anthropic client, created on first use and shared by every module.
+# The client keeps a pool of open HTTPS connections to the API, so reusing
+# it means later calls in the same run skip reading the key file again and
+# skip a fresh TLS handshake. (The heartbeat makes two calls per run.)
+_client: anthropic.Anthropic | None = None
+
+# Worker threads (see process_replies()) may all ask for the client at once;
+# the lock makes sure only one of them creates it
+_client_lock = threading.Lock()
 
 
-def build_prompt(entries: list[dict]) -> str:
+def get_anthropic_client() -> anthropic.Anthropic:
     """
-    Build the summarization prompt from journal entries.
+    Get the shared Anthropic API client, creating it on first use.
 
     Syntax notes:
-    - Triple-quoted strings (triple double-quotes) can span multiple lines
-    - f-strings (f"...") allow embedding expressions in curly braces
-    - The backslash at end of lines continues the string without adding newlines
-      (but we use triple quotes here so we don't need that)
-
-    Args:
-        entries: List of dicts with 'date', 'filename', and 'content' keys.
-                 Expected to be sorted by date ascending.
+    - `global _client` lets us assign the module-level variable
+    - The client is safe to share across threads
+    - `with _client_lock:` holds the lock for the indented block; _client is
+      checked again inside, since another thread may have created it while
+      we waited
 
     Returns:
-        The complete prompt string to send to Claude.
+        An anthropic.Anthropic client authenticated with our API key.
+
+    Raises:
+        FileNotFoundError: If the anthropic-api-key.txt file doesn't exist.
     """
-    # Get the date range for the summary title
-    # entries[0] is the first (oldest) entry, entries[-1] is the last (newest)
-    # -1 is Python's way of indexing from the end of a list
-    start_date = entries[0]["date"]
-    end_date = entries[-1]["date"]
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import anthropic
 
-    # Build the entries section by concatenating each entry's content
-    # We include clear separators so Claude can distinguish between entries
-    entries_text = ""
-    for entry in entries:
-        # .isoformat() converts a date to "YYYY-MM-DD" string format
-        entries_text += f"\n{'='*60}\n"  # 60 equals signs as a separator
-        entries_text += f"DATE: {entry['date'].isoformat()}\n"
-        entries_text += f"{'='*60}\n\n"
-        entries_text += entry["content"]
-        entries_text += "\n"
+                # We pass the key explicitly rather than using environment
+                # variables to keep our secrets management pattern consistent
+                _client = anthropic.Anthropic(api_key=get_anthropic_key())
+    return _client
+
+
+# Longest journal entry we send as-is. Anything longer (a pasted log, an
+# accidental dump) is cut off here, so one runaway file can't blow up the
+# prompt size - and the API cost - of the whole summary.
+_MAX_ENTRY_CHARS = 20_000
 
-    # The main prompt with instructions for Claude
-    # We're explicit about the output format we want
-    prompt = f"""Please analyze these work journal entries and create a bi-weekly summary.
 
-DATE RANGE: {start_date.isoformat()} to {end_date.isoformat()}
+# The instructions for the summary, sent as the "system prompt". They're
+# identical on every run (dates and entries go in the user message, see
+# build_prompt()), which lets the API cache them - see build_prompt().
+_SUMMARY_INSTRUCTIONS = """Please analyze the work journal entries in the user's message and create a bi-weekly summary.
 
 ## Output Format
 
-Create a summary using this exact structure:
+Create a summary using this exact structure, where [start date] and [end date] are the DATE RANGE given with the entries:
 
-# Bi-Weekly Summary: {start_date.isoformat()} to {end_date.isoformat()}
+# Bi-Weekly Summary: [start date] to [end date]
 
 ## Overview
 [2-3 sentence synthesis of what the past two weeks were about]
@@ -117,37 +158,203 @@ Create a summary using this exact structure:
 ## Looking Ahead
 - [Open threads, unresolved questions, momentum to carry forward]
 
-## Journal Entries
+---
 
-{entries_text}
+Generate the summary following the format above. Focus on synthesis and patterns rather than just listing what happened. Be concise but insightful.
+
+Respond with the summary only. No preamble, no restatement of these instructions, no closing remarks."""
+
+
+# Line of 60 equals signs separating entries in the prompt, so Claude can
+# tell where one day ends and the next begins
+_ENTRY_SEP = "=" * 60
+
+# Heading put before each entry; {} is filled in with the entry's date
+# via _ENTRY_HEADER.format(date)
+_ENTRY_HEADER = f"\n{_ENTRY_SEP}\nDATE: {{}}\n{_ENTRY_SEP}\n\n"
+
+# Response length budget when max_tokens isn't given: a fixed allowance
+# for the summary's headings and overview, plus some per entry summarized.
+# Capped by anthropic.max_tokens from config (see generate_summary()).
+_BASE_SUMMARY_TOKENS = 800
+_TOKENS_PER_ENTRY = 120
 
----
 
-Now generate the summary following the format above. Focus on synthesis and patterns rather than just listing what happened. Be concise but insightful."""
+def default_max_tokens(entries: list[dict]) -> int:
+    """
+    Response length limit for summarizing these entries.
+
+    Scales the limit with how much there is to summarize, so a rambling
+    answer about a quiet fortnight can't run up (and bill for) the full
+    config-wide limit.
+
+    Args:
+        entries: The journal entries to be summarized.
+
+    Returns:
+        The max_tokens value to send to the API.
+    """
+    return min(
+        config.get("anthropic.max_tokens"),
+        _BASE_SUMMARY_TOKENS + _TOKENS_PER_ENTRY * len(entries),
+    )
+
+
+def build_prompt(
+    entries: list[dict], feedback: list[str] | None = None
+) -> tuple[list[dict], list[dict]]:
+    """
+    Build the summarization prompt from journal entries.
+
+    The prompt is made of "content blocks" (the API accepts a list of them
+    in place of one string), ordered from most to least stable:
+    - System prompt: the fixed instructions (_SUMMARY_INSTRUCTIONS)
+    - User message, part 1: the entries, as a plain-text "document" block
+    - User message, part 2: this run's date range, any feedback the user
+      gave on earlier summaries, and a one-line request
+
+    The first two are marked as cacheable. The API caches a prompt by its
+    exact prefix, so everything that changes least has to come first: the
+    instructions are reused by every run, and the entries by any re-run
+    over the same entries within a few minutes (e.g. a retry), however the
+    short request at the end changes.
+
+    Syntax notes:
+    - f-strings (f"...") allow embedding expressions in curly braces
+    - `tuple[list[dict], list[dict]]` means we return a pair of lists of dicts
+
+    Args:
+        entries: List of dicts with 'date', 'filename', and 'content' keys.
+                 Expected to be sorted by date ascending.
+        feedback: Revision requests from replies to earlier summaries
+                  (see reply_processor.load_pending_feedback()).
+
+    Returns:
+        Tuple of (system_blocks, user_content) to send to Claude.
+    """
+    # Get the date range for the summary title
+    # entries[0] is the first (oldest) entry, entries[-1] is the last (newest)
+    # -1 is Python's way of indexing from the end of a list
+    start_date = entries[0]["date"]
+    end_date = entries[-1]["date"]
 
-    return prompt
+    # Build the entries text from each entry's content
+    # We include clear separators so Claude can distinguish between entries
+    #
+    # Strings can't be changed in place, so `text += more` copies all of
+    # `text` every time - slow once it holds days of entries. Instead we
+    # collect the pieces in a list and join them once at the end.
+    parts = []
+    seen_paragraphs = {}  # Shared across entries by dedupe_paragraphs()
+    for entry in entries:
+        # .isoformat() converts a date to "YYYY-MM-DD" string format
+        entry_date = entry["date"].isoformat()
+
+        # Strip filler (extra whitespace, template comments, wordy phrases,
+        # paragraphs repeated from earlier entries) that costs tokens
+        # without changing the summary - see compress.py
+        content = dedupe_paragraphs(compress(entry["content"]), entry_date, seen_paragraphs)
+        if len(content) > _MAX_ENTRY_CHARS:
+            content = content[:_MAX_ENTRY_CHARS] + "\n\n[... entry truncated ...]"
+
+        parts.append(_ENTRY_HEADER.format(entry_date))
+        parts.append(content)
+        parts.append("\n")
+
+    # "cache_control" asks the API to cache everything up to and including
+    # that block. A later request starting with the same blocks (within ~5
+    # minutes) reuses them at a tenth of the input-token price; writing the
+    # cache costs a quarter extra on those tokens. The API only caches
+    # prefixes above a minimum length (1024-4096 tokens, depending on the
+    # model), and silently ignores the marker below that.
+    system_blocks = [
+        {
+            "type": "text",
+            "text": _SUMMARY_INSTRUCTIONS,
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+    user_content = [
+        {
+            "type": "document",
+            "source": {
+                "type": "text",
+                "media_type": "text/plain",
+                "data": "".join(parts),
+            },
+            "title": "Journal Entries",
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+    # The last block changes run to run, so it goes after the cached ones
+    request = f"DATE RANGE: {start_date.isoformat()} to {end_date.isoformat()}\n\n"
+    if feedback:
+        request += "Feedback from the reader on earlier summaries - apply it to this one:\n"
+        request += "".join(f"- {item}\n" for item in feedback) + "\n"
+    request += "Summarize the journal entries in the document above."
+    user_content.append({"type": "text", "text": request})
+
+    return system_blocks, user_content
+
+
+def _entry_chars(entry: dict) -> int:
+    """Rough number of prompt characters one entry adds (see build_prompt())."""
+    return len(_ENTRY_HEADER) + min(len(entry["content"]), _MAX_ENTRY_CHARS)
+
+
+def _prompt_chars(system_blocks: list[dict], user_content: list[dict]) -> int:
+    """Total characters of text in the prompt blocks from build_prompt()."""
+    total = 0
+    for block in system_blocks + user_content:
+        if block["type"] == "document":
+            total += len(block["source"]["data"])
+        else:
+            total += len(block["text"])
+    return total
 
 
 def generate_summary(
     entries: list[dict],
     model: str | None = None,
     max_tokens: int | None = None,
-) -> str:
+    temperature: float | None = None,
+    on_text: Callable[[str], object] | None = None,
+    feedback: list[str] | None = None,
+) -> tuple[str, list[dict]]:
     """
     Call the Claude API to generate a summary of journal entries.
 
+    The response is streamed: text arrives in small pieces as Claude writes
+    it, rather than all at once after 10-30 seconds. Pass on_text to see
+    each piece as it arrives (main() uses this to print the summary live).
+
+    If the prompt is over the anthropic.max_prompt_tokens budget, the
+    oldest entries are left out. The entries actually summarized are
+    returned alongside the summary, so the caller can label the draft and
+    email with the right date range.
+
     Syntax notes:
     - Parameters default to None, then we read from config
     - This pattern allows: config defaults < function defaults < explicit args
     - `str | None` means the parameter can be a string or None (Python 3.10+)
+    - `Callable[[str], object]` means "a function taking one str argument"
+      (we ignore whatever it returns)
 
     Args:
         entries: List of journal entry dicts from gather_entries().
         model: The Claude model to use. Defaults to config value.
-        max_tokens: Maximum tokens in the response. Defaults to config value.
+        max_tokens: Maximum tokens in the response. Defaults to a budget based
+                    on the number of entries, capped at the config value.
+        temperature: Sampling temperature (0-1; lower is more focused and
+                     usually shorter). Defaults to config value.
+        on_text: Optional function called with each piece of text as it streams in.
+        feedback: Revision requests to apply, passed on to build_prompt().
 
     Returns:
-        The generated summary as a string.
+        Tuple of (summary, entries_used): the generated summary as a string,
+        and the entries it covers (the newest of `entries`, oldest first).
 
     Raises:
         anthropic.APIError: If the API call fails.
@@ -157,45 +364,312 @@ def generate_summary(
     # This is a common pattern: function param overrides config overrides default
     if model is None:
         model = config.get("anthropic.summary_model")
-    if max_tokens is None:
-        max_tokens = config.get("anthropic.max_tokens")
 
-    # Create the API client with our key
-    # We pass the key explicitly rather than using environment variables
-    # to keep our secrets management pattern consistent
-    client = anthropic.Anthropic(api_key=get_anthropic_key())
+    if temperature is None:
+        # Sampling temperature: None here too means "use the API's default"
+        temperature = config.get("anthropic.temperature")
+
+    # Build the prompt from all the entries
+    max_prompt_tokens = config.get("anthropic.max_prompt_tokens")
+    system_blocks, user_content = build_prompt(entries, feedback)
+
+    # With temperature 0 the same request gives (essentially) the same
+    # summary, so a re-run for the same entries can reuse the last answer
+    # instead of paying for it again - see cache.py.
+    #
+    # We look it up before any API call. The key covers the prompt built
+    # from ALL the entries plus the token budget, which together decide
+    # which entries get dropped below, so a hit needs no count_tokens()
+    # call either. The cache remembers how many entries that summary kept.
+    # (The default max_tokens is worked out from the same entries and
+    # config, so it's just as good a key ingredient as an explicit one.)
+    use_cache = temperature == 0
+    if use_cache:
+        cache_key = cache.summary_cache_key(
+            model,
+            max_tokens if max_tokens is not None else default_max_tokens(entries),
+            temperature,
+            system_blocks,
+            user_content,
+            max_prompt_tokens=max_prompt_tokens,
+        )
+        cached = cache.get_cached_summary(cache_key)
+        if cached is not None:
+            summary, entries_kept = cached
+            if on_text is not None:
+                on_text(summary)
+            # [-n:] is the last (newest) n entries
+            return summary, entries[-entries_kept:]
+
+    # Get the (shared) API client, authenticated with our key
+    client = get_anthropic_client()
+
+    # Check the prompt's size before we pay for it. If we're over budget
+    # (a pasted log, a very long backfill...), drop the oldest entries
+    # until it fits - the most recent work matters most for the summary.
+    #
+    # Rather than dropping one entry per count_tokens() call, we use the
+    # measured tokens-per-character ratio to estimate how many entries to
+    # drop, then count once more to confirm. The loop only goes round again
+    # if that estimate fell short.
+    while True:
+        prompt_chars = _prompt_chars(system_blocks, user_content)
+
+        # A token almost always covers at least one character of text, so
+        # if the character count is within budget, the token count is too,
+        # and we skip the extra round-trip of asking the API to count exactly
+        if prompt_chars <= max_prompt_tokens:
+            print(
+                f"Prompt size: {prompt_chars:,} characters "
+                f"(within the {max_prompt_tokens:,}-token budget)"
+            )
+            break
+
+        # count_tokens() is a free API call that returns how many input
+        # tokens a request would use
+        prompt_tokens = client.messages.count_tokens(
+            model=model,
+            system=system_blocks,
+            messages=[{"role": "user", "content": user_content}],
+        ).input_tokens
+        print(f"Prompt size: {prompt_tokens:,} input tokens")
+
+        if prompt_tokens <= max_prompt_tokens or len(entries) == 1:
+            break
+
+        # How many characters have to go, at this prompt's chars-per-token
+        excess_chars = (prompt_tokens - max_prompt_tokens) * prompt_chars / prompt_tokens
+
+        # Drop oldest entries until that many characters are gone
+        # (always keeping at least the newest entry)
+        drop = 0
+        freed = 0
+        while drop < len(entries) - 1 and freed < excess_chars:
+            freed += _entry_chars(entries[drop])
+            drop += 1
+
+        dropped = ", ".join(e["date"].isoformat() for e in entries[:drop])
+        print(f"  Over the {max_prompt_tokens:,}-token budget; dropping {drop} entry(s): {dropped}")
+        entries = entries[drop:]
+        system_blocks, user_content = build_prompt(entries, feedback)
+
+    # Response budget from the entries we're actually sending
+    if max_tokens is None:
+        max_tokens = default_max_tokens(entries)
 
-    # Build the prompt from the entries
-    prompt = build_prompt(entries)
+    # Optional API arguments, only sent when set
+    # (**extra_args below unpacks the dict into keyword arguments)
+    extra_args = {}
+    if temperature is not None:
+        extra_args["temperature"] = temperature
 
     # Call the Claude API
-    # messages.create() is the main method for sending messages to Claude
-    # It returns a Message object with the response
-    message = client.messages.create(
+    # messages.stream() sends the same request as messages.create(), but
+    # hands us the response as it's generated
+    # stream.text_stream yields just the text pieces (no event objects)
+    parts = []
+    with client.messages.stream(
         model=model,
         max_tokens=max_tokens,
+        system=system_blocks,
         messages=[
             {
                 "role": "user",
-                "content": prompt,
+                "content": user_content,
             }
         ],
-    )
+        **extra_args,
+    ) as stream:
+        for text in stream.text_stream:
+            parts.append(text)
+            if on_text is not None:
+                on_text(text)
+
+    # Join the pieces into the full summary
+    # (one join at the end, rather than += per piece, which would copy the
+    # growing string over and over)
+    summary = "".join(parts)
+
+    if use_cache:
+        cache.store_summary(cache_key, summary, len(entries))
+
+    return summary, entries
+
+
+# Most summaries generate_summaries() requests from the API at once
+_SUMMARY_WORKERS = 4
+
+
+def generate_summaries(
+    jobs: list[list[dict]],
+    model: str | None = None,
+    max_tokens: int | None = None,
+) -> list[tuple[str, list[dict]]]:
+    """
+    Generate several summaries concurrently (e.g. backfilling past periods).
+
+    Each summary is an independent API call that spends nearly all its time
+    waiting on the network, so we run a few at once on a thread pool
+    instead of one after another. They all share one Anthropic client (and
+    its pool of open connections), which is safe to use from several threads.
+
+    Syntax notes:
+    - executor.map(func, items) works like map() but runs calls on the pool,
+      still returning results in the same order as items
+    - The lambda passes our model/max_tokens through to each call
+
+    Args:
+        jobs: One list of journal entry dicts per summary to generate.
+        model: The Claude model to use. Defaults to config value.
+        max_tokens: Maximum tokens per response. Defaults as in generate_summary().
+
+    Returns:
+        One (summary, entries_used) tuple per job, as from generate_summary(),
+        in the same order as jobs.
+
+    Raises:
+        anthropic.APIError: If any API call fails.
+        FileNotFoundError: If the API key file doesn't exist.
+    """
+    if not jobs:
+        return []
 
-    # Extract the text from the response
-    # message.content is a list of content blocks (usually just one for text)
-    # content[0].text gets the actual text string
-    # We use [0] because the response could theoretically have multiple blocks
-    return message.content[0].text
+    # Create the shared client up front, so the threads don't each try to create it
+    get_anthropic_client()
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), _SUMMARY_WORKERS)) as executor:
+        return list(executor.map(
+            lambda entries: generate_summary(entries, model=model, max_tokens=max_tokens),
+            jobs,
+        ))
+
+
+# How often generate_summaries_batch() checks whether a batch has finished
+_BATCH_POLL_SECONDS = 30
+
+# How long generate_summaries_batch() waits by default before giving up on
+# a batch (the API itself allows up to 24 hours)
+_BATCH_TIMEOUT_SECONDS = 60 * 60
+
+
+def generate_summaries_batch(
+    jobs: list[list[dict]],
+    model: str | None = None,
+    max_tokens: int | None = None,
+    timeout: float = _BATCH_TIMEOUT_SECONDS,
+) -> list[tuple[str, list[dict]]]:
+    """
+    Generate several summaries through the Message Batches API.
+
+    For big backfills where nobody is waiting on the answer: all requests
+    are submitted in one HTTP call, Anthropic processes them in the
+    background (usually within minutes), and batch requests are billed at
+    half the normal price. We poll until the batch has finished, then
+    collect the results.
+
+    The wait is bounded. If the batch hasn't finished after `timeout`
+    seconds, we cancel it and generate every summary the normal way with
+    generate_summaries(). Any job whose batch request failed or expired is
+    retried the same way, so every job gets a summary.
+
+    Use generate_summaries() instead when you want the answers right away.
+
+    Syntax notes:
+    - custom_id is our own label for each request; results can come back in
+      any order, so we use it to put each summary back in its job's place
+    - time.monotonic() is a clock that only moves forward (unaffected by
+      system clock changes), which is what you want for measuring waits
+    - time.sleep(n) pauses for n seconds between status checks
+
+    Args:
+        jobs: One list of journal entry dicts per summary to generate.
+        model: The Claude model to use. Defaults to config value.
+        max_tokens: Maximum tokens per response. Defaults as in generate_summary().
+        timeout: Seconds to wait for the batch before cancelling it.
+
+    Returns:
+        One (summary, entries_used) tuple per job, in the same order as jobs.
+        Batch requests send every entry of their job; jobs that fall back to
+        generate_summary() may have their oldest entries dropped.
+
+    Raises:
+        anthropic.APIError: If submitting the batch or a fallback call fails.
+        FileNotFoundError: If the API key file doesn't exist.
+    """
+    import time
+
+    if not jobs:
+        return []
+
+    if model is None:
+        model = config.get("anthropic.summary_model")
+
+    client = get_anthropic_client()
+
+    temperature = config.get("anthropic.temperature")
+
+    requests = []
+    for i, entries in enumerate(jobs):
+        system_blocks, user_content = build_prompt(entries)
+        params = {
+            "model": model,
+            "max_tokens": max_tokens or default_max_tokens(entries),
+            "system": system_blocks,
+            "messages": [{"role": "user", "content": user_content}],
+        }
+        if temperature is not None:
+            params["temperature"] = temperature
+        requests.append({"custom_id": f"job-{i}", "params": params})
+
+    batch = client.messages.batches.create(requests=requests)
+    print(f"Submitted batch {batch.id} ({len(requests)} summaries)...")
+
+    results: list[tuple[str, list[dict]] | None] = [None] * len(jobs)
+
+    deadline = time.monotonic() + timeout
+    while batch.processing_status != "ended" and time.monotonic() < deadline:
+        time.sleep(min(_BATCH_POLL_SECONDS, max(0, deadline - time.monotonic())))
+        batch = client.messages.batches.retrieve(batch.id)
+
+    if batch.processing_status == "ended":
+        for item in client.messages.batches.results(batch.id):
+            # "job-3" -> 3
+            index = int(item.custom_id.removeprefix("job-"))
+            if item.result.type == "succeeded":
+                results[index] = (item.result.message.content[0].text, jobs[index])
+            else:
+                # "errored", "canceled", or "expired"
+                print(f"Warning: batch summary {index} did not succeed ({item.result.type})")
+    else:
+        # Out of time: stop paying for the batch and do it the normal way
+        print(f"Batch {batch.id} still running after {timeout:.0f}s; cancelling it.")
+        client.messages.batches.cancel(batch.id)
+
+    # Anything without a result is generated directly instead
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        print(f"Generating {len(missing)} summary(s) without the batch...")
+        fallback = generate_summaries([jobs[i] for i in missing], model=model, max_tokens=max_tokens)
+        for i, result in zip(missing, fallback):
+            results[i] = result
+
+    return results
 
 
 def save_draft(summary: str, entries: list[dict], summaries_path: Path | None = None) -> Path:
     """
     Save the summary as a draft file in the periodic-summaries directory.
 
+    The file is written atomically: we write a temp file next to it, then
+    os.replace() it into place. If the run dies mid-write, the draft is
+    either the old one or the new one, never half of one (which would
+    still count as "a recent summary" and suppress the next run).
+
     Syntax notes:
     - Path objects support / operator for joining paths
     - .write_text() writes a string to a file (creates or overwrites)
+    - os.replace(src, dst) renames src to dst, replacing dst if it exists,
+      in one atomic step
     - f-strings can contain any valid Python expression in the braces
 
     Args:
@@ -217,5 +691,7 @@ def save_draft(summary: str, entries: list[dict], summaries_path: Path | None =
     filename = f"{today}-SUMMARY-14-days-DRAFT.md"
     draft_path = summaries_path / filename
 
-    draft_path.write_text(summary)
+    tmp_path = draft_path.with_suffix(".md.tmp")
+    tmp_path.write_text(summary, encoding="utf-8")
+    os.replace(tmp_path, draft_path)
     return draft_path
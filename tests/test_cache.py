@@ -0,0 +1,55 @@
+"""Tests for cache.py, the file-backed summary cache."""
+
+from pathlib import Path
+
+import pytest
+
+from summarizer import cache
+
+_SYSTEM = [{"type": "text", "text": "Summarize."}]
+_CONTENT = [{"type": "text", "text": "2026-01-07: shipped the parser"}]
+_BASE = {
+    "model": "claude-haiku-4-5",
+    "max_tokens": 1000,
+    "temperature": 0,
+    "system": _SYSTEM,
+    "user_content": _CONTENT,
+}
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"model": "claude-sonnet-4-5"},
+        {"max_tokens": 2000},
+        {"temperature": 0.2},
+        {"system": [{"type": "text", "text": "Summarize briefly."}]},
+        {"user_content": [{"type": "text", "text": "2026-01-07: fixed a bug"}]},
+        {"max_prompt_tokens": 50_000},
+    ],
+)
+def test_summary_cache_key_changes(change: dict) -> None:
+    assert cache.summary_cache_key(**_BASE) != cache.summary_cache_key(**(_BASE | change))
+
+
+def test_summary_cache_key_is_stable() -> None:
+    assert cache.summary_cache_key(**_BASE) == cache.summary_cache_key(**dict(_BASE))
+
+
+@pytest.fixture
+def home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point Path.home() (and so the cache directory) at a temp dir."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_get_cached_summary_miss(home: Path) -> None:
+    assert cache.get_cached_summary("0" * 64) is None
+
+
+def test_store_then_get_round_trips(home: Path) -> None:
+    key = cache.summary_cache_key(**_BASE)
+    cache.store_summary(key, "## Summary\n\n- Shipped the parser\n", 3)
+
+    assert cache.get_cached_summary(key) == ("## Summary\n\n- Shipped the parser\n", 3)
+    assert cache.get_summary_cache_path().is_relative_to(home)
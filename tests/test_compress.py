@@ -0,0 +1,53 @@
+"""Tests for compress.py: the local rules that shrink journal text."""
+
+import pytest
+
+from summarizer.compress import compress, dedupe_paragraphs
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        # Wordy phrases become their exact synonyms, keeping a leading capital
+        ("In order to ship, we tested.", "To ship, we tested."),
+        ("Slow due to the fact that it polls.", "Slow because it polls."),
+        # Not exact synonyms, so left alone
+        ("Notes with regard to the API.", "Notes with regard to the API."),
+        # Inner runs of spaces collapse; indentation doesn't
+        ("a   b\n    - nested", "a b\n    - nested"),
+        # Trailing whitespace goes, except a markdown line break after text
+        ("one \t\ntwo  \nthree", "one\ntwo  \nthree"),
+        # Template comments go, and runs of blank lines shrink to one
+        ("a<!-- hint -->\n\n\n\nb", "a\n\nb"),
+    ],
+)
+def test_compress(text: str, expected: str) -> None:
+    assert compress(text) == expected
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "```\nin order to   keep  \n\n\n\n```",
+        "`in order to   keep`",
+    ],
+)
+def test_compress_leaves_code_alone(code: str) -> None:
+    assert compress(f"Before {code} after") == f"Before {code} after"
+
+
+def test_dedupe_paragraphs_replaces_repeats_from_earlier_entries() -> None:
+    boilerplate = "## Standup\nWhat did I do yesterday, and what's next today?"
+    seen: dict[bytes, str] = {}
+
+    first = dedupe_paragraphs(f"{boilerplate}\n\nShipped the parser.", "2026-01-07", seen)
+    second = dedupe_paragraphs(f"{boilerplate}\n\nFixed a bug.", "2026-01-08", seen)
+
+    assert first == f"{boilerplate}\n\nShipped the parser."
+    assert second == "[same as a paragraph from 2026-01-07]\n\nFixed a bug."
+
+
+def test_dedupe_paragraphs_keeps_short_paragraphs() -> None:
+    seen: dict[bytes, str] = {}
+    dedupe_paragraphs("- Tests pass", "2026-01-07", seen)
+    assert dedupe_paragraphs("- Tests pass", "2026-01-08", seen) == "- Tests pass"
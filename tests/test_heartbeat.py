@@ -0,0 +1,46 @@
+"""Tests for heartbeat.py's checkpoint handling (no network, no Claude)."""
+
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from summarizer.heartbeat import (
+    _MAX_STALE_DATES,
+    check_stale_staging,
+    format_journal_from_checkpoints,
+)
+
+
+def _touch_checkpoints(staging: Path, day: date) -> None:
+    (staging / f"{day.isoformat()}-checkpoints.md").write_text("- note\n")
+
+
+def test_check_stale_staging_keeps_newest_dates(tmp_path: Path) -> None:
+    today = date.today()
+    stale = [today - timedelta(days=n) for n in range(1, _MAX_STALE_DATES + 6)]
+    for day in stale + [today]:
+        _touch_checkpoints(tmp_path, day)
+    (tmp_path / "notes.md").write_text("not a checkpoint file")
+
+    # The newest _MAX_STALE_DATES stale days, oldest first; never today
+    assert check_stale_staging(tmp_path) == sorted(stale)[-_MAX_STALE_DATES:]
+
+
+def test_check_stale_staging_missing_dir(tmp_path: Path) -> None:
+    assert check_stale_staging(tmp_path / "missing") == []
+
+
+@pytest.mark.parametrize(
+    ("notes", "bullets"),
+    [
+        ("# Checkpoints\n- Fixed login\n* Wrote tests\n", "- Fixed login\n- Wrote tests"),
+        # Sub-headings are notes too; only the top-level title is dropped
+        ("# Checkpoints\n## Fixed login bug\nadded retry\n", "- Fixed login bug\n- added retry"),
+        ("# Checkpoints\n\n", "- (empty checkpoint notes)"),
+    ],
+)
+def test_format_journal_from_checkpoints(notes: str, bullets: str) -> None:
+    entry = format_journal_from_checkpoints(notes, date(2026, 1, 7))
+    assert entry.startswith("# Work Journal: 2026-01-07\n")
+    assert f"### What Was Worked On\n{bullets}\n" in entry
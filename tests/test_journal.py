@@ -0,0 +1,29 @@
+"""Tests for journal.py's file reading."""
+
+from pathlib import Path
+
+import pytest
+
+from summarizer.journal import read_file_text
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (b"# Title\n\n- note\n", "# Title\n\n- note\n"),
+        # Line endings are translated like Path.read_text() does
+        (b"# Title\r\n\r\n---\r\n", "# Title\n\n---\n"),
+        (b"old\rmac\r", "old\nmac\n"),
+        ("café\r\n".encode(), "café\n"),
+    ],
+)
+def test_read_file_text(tmp_path: Path, raw: bytes, expected: str) -> None:
+    path = tmp_path / "2026-01-07.md"
+    path.write_bytes(raw)
+    assert read_file_text(path) == expected
+    assert read_file_text(path) == path.read_text(encoding="utf-8")
+
+
+def test_read_file_text_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        read_file_text(tmp_path / "missing.md")
@@ -0,0 +1,167 @@
+"""Tests for reply_processor.py's local reply handling (no Gmail, no Claude)."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from summarizer import reply_processor
+from summarizer.reply_processor import (
+    _APPROVE_RE,
+    _classify_cache_key,
+    _normalize_reply,
+    classify_reply,
+    clear_pending_feedback,
+    load_pending_feedback,
+    save_feedback,
+)
+
+
+@pytest.mark.parametrize(
+    ("reply", "approves"),
+    [
+        ("LGTM", True),
+        ("Looks good!\n\nOn Mon, Jan 5, Bot wrote:\n> ...", True),
+        ("👍", True),
+        ("Looks good but mention the migration", False),
+    ],
+)
+def test_bare_approvals(reply: str, approves: bool) -> None:
+    assert bool(_APPROVE_RE.match(_normalize_reply(reply))) == approves
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        # Whitespace differences don't matter
+        ("Please add  more\ndetail.", "Please add more detail."),
+        # Nor does the quoted original email
+        (
+            "Please add more detail.\n\nOn Mon, Jan 5, Bot wrote:\n> Summary...",
+            "Please add more detail.",
+        ),
+    ],
+)
+def test_classify_cache_key_same(a: str, b: str) -> None:
+    assert _classify_cache_key(a, "haiku") == _classify_cache_key(b, "haiku")
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        # Identical for the first 200+ characters, different feedback after that
+        (("x" * 250 + " focus on X", "haiku"), ("x" * 250 + " focus on Y", "haiku")),
+        # Same reply, different model
+        (("Please add more detail.", "haiku"), ("Please add more detail.", "sonnet")),
+    ],
+)
+def test_classify_cache_key_different(a: tuple[str, str], b: tuple[str, str]) -> None:
+    assert _classify_cache_key(*a) != _classify_cache_key(*b)
+
+
+def _fake_client(response_text: str) -> SimpleNamespace:
+    """A stand-in Anthropic client whose messages.create() returns response_text."""
+    message = SimpleNamespace(content=[SimpleNamespace(text=response_text)])
+    return SimpleNamespace(messages=SimpleNamespace(create=lambda **kwargs: message))
+
+
+@pytest.mark.parametrize(
+    ("response_text", "expected", "cached"),
+    [
+        ("CLASSIFICATION: REVISE\nFEEDBACK: More detail.", ("REVISE", "More detail."), True),
+        # Unparseable response: UNCLEAR, and not remembered
+        ("I'm not sure what you mean.", ("UNCLEAR", ""), False),
+    ],
+)
+def test_classify_reply_caches_only_parsed_answers(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    response_text: str,
+    expected: tuple[str, str],
+    cached: bool,
+) -> None:
+    monkeypatch.setattr(reply_processor, "get_anthropic_client", lambda: _fake_client(response_text))
+    monkeypatch.setattr(reply_processor, "get_classify_cache_path", lambda: tmp_path / "cache.json")
+    monkeypatch.setattr(reply_processor, "_classify_cache", None)
+
+    reply = "Can you add more detail on the parser work?"
+    assert classify_reply(reply, model="haiku") == expected
+    key = _classify_cache_key(reply, "haiku")
+    assert (key in reply_processor._get_classify_cache()) == cached
+
+
+@pytest.fixture
+def secrets(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Keep pending feedback in a temp dir."""
+    monkeypatch.setattr(reply_processor, "get_secrets_path", lambda: tmp_path)
+    return tmp_path
+
+
+def test_pending_feedback_imports_legacy_file_once(secrets: Path) -> None:
+    legacy = secrets / "pending-feedback.json"
+    legacy.write_text(json.dumps([{"feedback": "Shorter.", "timestamp": "2026-01-05T09:00:00"}]))
+
+    save_feedback("More on the parser.")
+
+    assert [item["feedback"] for item in load_pending_feedback()] == ["Shorter.", "More on the parser."]
+    assert not legacy.exists()
+    assert (secrets / "pending-feedback.json.imported").exists()
+
+
+@pytest.mark.parametrize(("count", "left"), [(1, ["b", "c"]), (3, [])])
+def test_clear_pending_feedback(secrets: Path, count: int, left: list[str]) -> None:
+    for feedback in ["a", "b", "c"]:
+        save_feedback(feedback)
+
+    clear_pending_feedback(count)
+
+    assert [item["feedback"] for item in load_pending_feedback()] == left
+
+
+@pytest.mark.parametrize(
+    ("finalize", "marked", "subject", "result"),
+    [
+        (lambda: True, ["r1"], "[Work Journal] Summary Approved", 1),
+        # No draft: still handled, but not reported as approved
+        (lambda: False, ["r1"], "[Work Journal] No Draft to Approve", 1),
+    ],
+)
+def test_process_replies_approval(
+    monkeypatch: pytest.MonkeyPatch, finalize, marked: list[str], subject: str, result: int
+) -> None:
+    calls = _patch_processing(monkeypatch, finalize)
+    assert reply_processor.process_replies() == result
+    assert calls["marked"] == marked
+    assert [email[1] for email in calls["sent"]] == [subject]
+
+
+def test_process_replies_leaves_failed_reply_unread(monkeypatch: pytest.MonkeyPatch) -> None:
+    def finalize() -> bool:
+        raise PermissionError("read-only file system")
+
+    calls = _patch_processing(monkeypatch, finalize)
+    assert reply_processor.process_replies() == -1
+    assert calls["marked"] == []
+    assert calls["sent"] == []
+
+
+def _patch_processing(monkeypatch: pytest.MonkeyPatch, finalize) -> dict:
+    """Run process_replies() on one "LGTM" reply with Gmail and files swapped out."""
+    calls: dict = {"marked": None, "sent": None}
+    reply = {"id": "r1", "thread_id": "t1", "subject": "Re: summary", "from": "me", "body": "LGTM"}
+
+    def mark(ids: list[str]) -> bool:
+        calls["marked"] = ids
+        return True
+
+    def send(messages: list) -> list[bool]:
+        calls["sent"] = messages
+        return [True] * len(messages)
+
+    monkeypatch.setattr(reply_processor, "get_unread_replies", lambda: [reply])
+    monkeypatch.setattr(reply_processor, "finalize_draft", finalize)
+    monkeypatch.setattr(reply_processor, "mark_as_read_batch", mark)
+    monkeypatch.setattr(reply_processor, "send_emails_batch", send)
+    monkeypatch.setattr(reply_processor.config, "get", lambda key, default=None: default)
+    return calls
@@ -0,0 +1,152 @@
+"""Tests for generate_summary()'s prompt budget and cache (with a fake client)."""
+
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from summarizer import config, summarize
+
+_SETTINGS = {
+    "anthropic.summary_model": "claude-haiku-4-5",
+    "anthropic.max_tokens": 4096,
+    "anthropic.temperature": 0,
+    "anthropic.max_prompt_tokens": 30_000,
+}
+
+
+class _FakeMessages:
+    """Counts one token per 3 characters and always "writes" the same summary."""
+
+    def __init__(self) -> None:
+        self.count_calls = 0
+        self.stream_calls = 0
+
+    def count_tokens(self, model: str, system: list, messages: list) -> SimpleNamespace:
+        self.count_calls += 1
+        chars = summarize._prompt_chars(system, messages[0]["content"])
+        return SimpleNamespace(input_tokens=chars // 3)
+
+    def stream(self, **kwargs) -> "_FakeStream":
+        self.stream_calls += 1
+        return _FakeStream()
+
+
+class _FakeBatches:
+    """Message Batches stand-in: the batch ends with `outcome` for every request."""
+
+    def __init__(self, ended: bool, outcome: str = "succeeded") -> None:
+        self.ended = ended
+        self.outcome = outcome
+        self.cancelled = False
+        self.custom_ids: list[str] = []
+
+    def _batch(self) -> SimpleNamespace:
+        return SimpleNamespace(id="batch-1", processing_status="ended" if self.ended else "in_progress")
+
+    def create(self, requests: list[dict]) -> SimpleNamespace:
+        self.custom_ids = [r["custom_id"] for r in requests]
+        return self._batch()
+
+    def retrieve(self, batch_id: str) -> SimpleNamespace:
+        return self._batch()
+
+    def cancel(self, batch_id: str) -> None:
+        self.cancelled = True
+
+    def results(self, batch_id: str) -> list[SimpleNamespace]:
+        message = SimpleNamespace(content=[SimpleNamespace(text="## Batch summary")])
+        return [
+            SimpleNamespace(custom_id=cid, result=SimpleNamespace(type=self.outcome, message=message))
+            for cid in reversed(self.custom_ids)  # Any order
+        ]
+
+
+class _FakeStream:
+    text_stream = ["## Summary"]
+
+    def __enter__(self) -> "_FakeStream":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_messages(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> _FakeMessages:
+    messages = _FakeMessages()
+    monkeypatch.setattr(summarize, "get_anthropic_client", lambda: SimpleNamespace(messages=messages))
+    monkeypatch.setattr(config, "get", lambda key, default=None: _SETTINGS.get(key, default))
+    monkeypatch.setenv("HOME", str(tmp_path))  # Summary cache goes under ~/.cache
+    return messages
+
+
+def _entries(days: int, chars: int) -> list[dict]:
+    # Content varies per day so dedupe_paragraphs() leaves it alone
+    return [
+        {"date": date(2026, 1, d), "content": (f"day {d} work " * chars)[:chars]}
+        for d in range(1, days + 1)
+    ]
+
+
+def test_over_budget_drops_oldest_entries(fake_messages: _FakeMessages) -> None:
+    # 14 entries of ~20k characters is ~90k tokens against a 30k budget
+    entries = _entries(14, 20_000)
+
+    summary, used = summarize.generate_summary(entries)
+
+    assert summary == "## Summary"
+    assert used == entries[-len(used):]
+    assert 1 <= len(used) < len(entries)
+    # One count to measure, one to confirm the estimate
+    assert fake_messages.count_calls == 2
+
+
+def test_cache_hit_makes_no_api_calls(fake_messages: _FakeMessages) -> None:
+    entries = _entries(14, 20_000)
+    first = summarize.generate_summary(entries)
+    calls = (fake_messages.count_calls, fake_messages.stream_calls)
+
+    assert summarize.generate_summary(entries) == first
+    assert (fake_messages.count_calls, fake_messages.stream_calls) == calls
+
+
+def test_under_budget_skips_count_tokens(fake_messages: _FakeMessages) -> None:
+    entries = _entries(3, 1_000)
+
+    assert summarize.generate_summary(entries) == ("## Summary", entries)
+    assert fake_messages.count_calls == 0
+
+
+@pytest.mark.parametrize(
+    ("ended", "outcome", "expected", "cancelled"),
+    [
+        (True, "succeeded", "## Batch summary", False),
+        # Failed requests are generated directly instead
+        (True, "errored", "## Summary", False),
+        # Out of time: cancel, then generate directly
+        (False, "succeeded", "## Summary", True),
+    ],
+)
+def test_generate_summaries_batch(
+    fake_messages: _FakeMessages, ended: bool, outcome: str, expected: str, cancelled: bool
+) -> None:
+    fake_messages.batches = _FakeBatches(ended, outcome)
+    jobs = [_entries(2, 500), _entries(3, 500)]
+
+    results = summarize.generate_summaries_batch(jobs, timeout=0)
+
+    assert results == [(expected, jobs[0]), (expected, jobs[1])]
+    assert fake_messages.batches.cancelled == cancelled
+
+
+def test_build_prompt_adds_feedback_after_the_cached_blocks() -> None:
+    entries = _entries(2, 100)
+    _, plain = summarize.build_prompt(entries)
+    _, with_feedback = summarize.build_prompt(entries, ["Shorter, please."])
+
+    # The cached entries document is unchanged; only the final request differs
+    assert with_feedback[0] == plain[0]
+    assert "- Shorter, please." in with_feedback[-1]["text"]
+    assert "Shorter" not in plain[-1]["text"]